@@ -0,0 +1,141 @@
+"""
+Numeric kernels for the tracking hot path
+JIT-compiled with Numba when it is installed, plain Python otherwise
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def calc_move(face_x, face_y, center_x, center_y, inv_width, inv_height,
+              smoothed, smoothing, gain, threshold_sq):
+    """
+    Smooth the face offset from the frame center and turn it into head adjustments
+
+    Args:
+        inv_width, inv_height: Reciprocal frame dimensions
+        smoothed: float64 array [error_x, error_y], updated in place
+        threshold_sq: Squared minimum movement magnitude
+
+    Returns:
+        (pan_adjustment, roll_adjustment, moved) where moved is False if the
+        adjustment is below the movement threshold
+    """
+    error_x = (face_x - center_x) * inv_width
+    error_y = (face_y - center_y) * inv_height
+
+    alpha = 1.0 - smoothing
+    smoothed[0] = alpha * error_x + smoothing * smoothed[0]
+    smoothed[1] = alpha * error_y + smoothing * smoothed[1]
+
+    pan_adjustment = -smoothed[0] * gain
+    roll_adjustment = -smoothed[1] * gain
+
+    magnitude_sq = pan_adjustment * pan_adjustment + roll_adjustment * roll_adjustment
+    return pan_adjustment, roll_adjustment, magnitude_sq >= threshold_sq
+
+
+@njit(cache=True, fastmath=True)
+def analyze_wave(points, window, movement_threshold, vertical_threshold,
+                 min_wave_speed, wave_threshold, min_waves):
+    """
+    Smooth a wrist track and check it for a horizontal wave in one pass
+
+    Args:
+        points: (N, 2) float64 array of wrist (x, y) positions, oldest first
+        window: Moving average window, shrunk at the edges
+
+    Returns:
+        bool: True if the track has enough horizontal range, speed and
+        direction changes while staying within the vertical threshold
+    """
+    n = points.shape[0]
+    if n < 3:
+        return False
+
+    # Moving average smoothing
+    half = window // 2
+    xs = np.empty(n)
+    y_min = 0.0
+    y_max = 0.0
+    for i in range(n):
+        start = max(0, i - half)
+        end = min(n, i + half + 1)
+        sum_x = 0.0
+        sum_y = 0.0
+        for j in range(start, end):
+            sum_x += points[j, 0]
+            sum_y += points[j, 1]
+        xs[i] = sum_x / (end - start)
+        y = sum_y / (end - start)
+        if i == 0 or y < y_min:
+            y_min = y
+        if i == 0 or y > y_max:
+            y_max = y
+
+    # Vertical movement should be minimal for a horizontal wave
+    if y_max - y_min > vertical_threshold:
+        return False
+
+    # Speed, significant direction changes and horizontal range together
+    speed_sum = 0.0
+    direction_changes = 0
+    x_min = xs[0]
+    x_max = xs[0]
+    prev_delta = 0.0
+    for i in range(1, n):
+        delta = xs[i] - xs[i - 1]
+        speed_sum += abs(delta)
+        if (i > 1 and abs(prev_delta) > movement_threshold and abs(delta) > movement_threshold
+                and prev_delta * delta < 0):
+            direction_changes += 1
+        prev_delta = delta
+        x_min = min(x_min, xs[i])
+        x_max = max(x_max, xs[i])
+
+    if speed_sum / (n - 1) < min_wave_speed:
+        return False
+
+    return x_max - x_min > wave_threshold and direction_changes >= min_waves
+
+
+@njit(cache=True, fastmath=True)
+def step_head(current, target, last_sent, rate, epsilon, flush):
+    """
+    Move the head position a fraction of the way to the target
+
+    Args:
+        current: float64 array [pan, roll, pitch], updated in place
+        target: float64 array [pan, roll, pitch]
+        last_sent: float64 array of the last commanded position, updated in place
+            when a move is due
+        rate: Fraction of the remaining distance covered this step
+        epsilon: Smallest per-axis change (degrees) worth commanding
+        flush: Command any change at all, so small residual offsets still land
+
+    Returns:
+        bool: True if the head should be moved to current
+    """
+    threshold = 0.0 if flush else epsilon
+    moved = False
+    for i in range(current.shape[0]):
+        current[i] += (target[i] - current[i]) * rate
+        if abs(current[i] - last_sent[i]) > threshold:
+            moved = True
+
+    if moved:
+        for i in range(current.shape[0]):
+            last_sent[i] = current[i]
+    return moved
@@ -0,0 +1,227 @@
+"""
+Face Detector - BlazeFace executed through onnxruntime
+Drop-in replacement for MediaPipe's FaceDetection when an ONNX model is available
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ort = None
+    ONNXRUNTIME_AVAILABLE = False
+
+# INT8 short-range BlazeFace (e.g. int8/face_detector.onnx + .data from
+# Heliosoph/mediapipe-face-onnx), not shipped with the repo
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent.parent / "models" / "face_detector.onnx"
+
+# Execution providers tried for each accelerator choice, CPU is always the fallback
+ACCEL_PROVIDERS = {
+    'cpu': [],
+    # Snapdragon Hexagon NPU
+    'qnn': [('QNNExecutionProvider', {'backend_path': 'libQnnHtp.so'})],
+    # Intel iGPU/NPU
+    'openvino': [('OpenVINOExecutionProvider', {'device_type': 'GPU'})],
+    # Android/Linux NNAPI
+    'nnapi': [('NnapiExecutionProvider', {})],
+}
+
+
+def get_providers(accel='cpu'):
+    """
+    Build the onnxruntime provider list for an accelerator, skipping
+    providers this onnxruntime build does not ship
+
+    Returns:
+        (providers, provider_options) lists for InferenceSession
+    """
+    available = ort.get_available_providers() if ONNXRUNTIME_AVAILABLE else []
+    providers = []
+    provider_options = []
+    for name, options in ACCEL_PROVIDERS.get(accel, []):
+        if name in available:
+            providers.append(name)
+            provider_options.append(options)
+        else:
+            print(f"Warning: {name} is not available, falling back to CPU")
+
+    providers.append('CPUExecutionProvider')
+    provider_options.append({})
+    return providers, provider_options
+
+
+def _generate_anchors(input_size, strides=(8, 16, 16, 16)):
+    """
+    SSD anchor centers for the short-range BlazeFace model (fixed anchor size,
+    two anchors per layer, layers with the same stride share one grid)
+    """
+    anchors = []
+    layer = 0
+    while layer < len(strides):
+        stride = strides[layer]
+        anchors_per_cell = 0
+        while layer < len(strides) and strides[layer] == stride:
+            anchors_per_cell += 2
+            layer += 1
+
+        grid = int(np.ceil(input_size / stride))
+        ys, xs = np.mgrid[0:grid, 0:grid]
+        centers = np.stack(((xs + 0.5) / grid, (ys + 0.5) / grid), axis=-1).reshape(-1, 2)
+        anchors.append(np.repeat(centers, anchors_per_cell, axis=0))
+
+    return np.concatenate(anchors).astype(np.float32)
+
+
+class OnnxFaceDetection:
+    """
+    BlazeFace face detector on onnxruntime.
+    process() returns results shaped like MediaPipe's so callers can use
+    results.detections[i].location_data.relative_bounding_box unchanged.
+    """
+
+    def __init__(self, model_path=DEFAULT_MODEL_PATH, min_detection_confidence=0.5,
+                 iou_threshold=0.3, num_threads=2, accel='cpu'):
+        """
+        Initialize the detector
+
+        Args:
+            model_path: Path to the BlazeFace ONNX model
+            min_detection_confidence: Minimum score for a detection to be reported
+            iou_threshold: Overlap above which weaker detections are suppressed
+            num_threads: onnxruntime intra-op threads
+            accel: Accelerator to run on, one of ACCEL_PROVIDERS
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed")
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = num_threads
+        providers, provider_options = get_providers(accel)
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options, providers=providers, provider_options=provider_options
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+
+        # Accept both NHWC and NCHW exports
+        shape = model_input.shape
+        self.channels_first = shape[1] == 3
+        size = shape[2] if self.channels_first else shape[1]
+        self.input_size = (size, size)
+
+        # Input tensor reused across frames and bound once, process() refills it in place
+        if self.channels_first:
+            self._input = np.empty((1, 3, size, size), dtype=np.float32)
+            self._input_hwc = self._input[0].transpose(1, 2, 0)
+        else:
+            self._input = np.empty((1, size, size, 3), dtype=np.float32)
+            self._input_hwc = self._input[0]
+        self._resize_buf = np.empty((size, size, 3), dtype=np.uint8)
+
+        self._binding = self.session.io_binding()
+        self._binding.bind_cpu_input(self.input_name, self._input)
+        for output in self.session.get_outputs():
+            self._binding.bind_output(output.name)
+
+        self.anchors = _generate_anchors(size)
+        self.min_detection_confidence = min_detection_confidence
+        self.iou_threshold = iou_threshold
+
+    def _preprocess(self, image, bgr=False):
+        """
+        Resize to the model input and normalize to [-1, 1] into the bound input tensor.
+        BGR input is swapped through a reversed channel view during normalization.
+        """
+        if image.shape[1::-1] != self.input_size:
+            image = cv2.resize(image, self.input_size, dst=self._resize_buf,
+                               interpolation=cv2.INTER_AREA)
+        if bgr:
+            image = image[:, :, ::-1]
+
+        np.subtract(image, 127.5, out=self._input_hwc, casting='unsafe')
+        np.multiply(self._input_hwc, 1.0 / 127.5, out=self._input_hwc)
+
+    def _decode(self, boxes, scores):
+        """Turn raw regressors/scores into relative (xmin, ymin, width, height) boxes"""
+        scores = 1.0 / (1.0 + np.exp(-np.clip(scores, -100.0, 100.0)))
+        keep = scores >= self.min_detection_confidence
+        if not keep.any():
+            return []
+
+        size = self.input_size[0]
+        anchors = self.anchors[keep]
+        raw = boxes[keep]
+        scores = scores[keep]
+
+        x_center = raw[:, 0] / size + anchors[:, 0]
+        y_center = raw[:, 1] / size + anchors[:, 1]
+        width = raw[:, 2] / size
+        height = raw[:, 3] / size
+        rects = np.stack((x_center - width / 2, y_center - height / 2, width, height), axis=-1)
+
+        # Greedy non-maximum suppression, strongest detection first
+        order = np.argsort(-scores)
+        detections = []
+        while order.size:
+            best = order[0]
+            detections.append((rects[best], float(scores[best])))
+
+            rest = order[1:]
+            x1 = np.maximum(rects[best, 0], rects[rest, 0])
+            y1 = np.maximum(rects[best, 1], rects[rest, 1])
+            x2 = np.minimum(rects[best, 0] + rects[best, 2], rects[rest, 0] + rects[rest, 2])
+            y2 = np.minimum(rects[best, 1] + rects[best, 3], rects[rest, 1] + rects[rest, 3])
+            overlap = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+            union = rects[best, 2] * rects[best, 3] + rects[rest, 2] * rects[rest, 3] - overlap
+            order = rest[overlap / np.maximum(union, 1e-6) <= self.iou_threshold]
+
+        return detections
+
+    def process(self, image_rgb):
+        """
+        Detect faces in an RGB image
+
+        Returns:
+            Object with a MediaPipe-style .detections list
+        """
+        return self.process_bgr(image_rgb, bgr=False)
+
+    def process_bgr(self, image_bgr, bgr=True):
+        """
+        Detect faces in a BGR image without a separate color conversion
+
+        Returns:
+            Object with a MediaPipe-style .detections list
+        """
+        self._preprocess(image_bgr, bgr)
+        self.session.run_with_iobinding(self._binding)
+        outputs = self._binding.copy_outputs_to_cpu()
+
+        # Regressors carry 16 values per anchor, classificators a single score
+        boxes = next(out for out in outputs if out.shape[-1] == 16).reshape(-1, 16)
+        scores = next(out for out in outputs if out.shape[-1] == 1).reshape(-1)
+
+        detections = [
+            SimpleNamespace(
+                score=[score],
+                location_data=SimpleNamespace(
+                    relative_bounding_box=SimpleNamespace(
+                        xmin=float(rect[0]), ymin=float(rect[1]),
+                        width=float(rect[2]), height=float(rect[3])
+                    )
+                )
+            )
+            for rect, score in self._decode(boxes, scores)
+        ]
+        return SimpleNamespace(detections=detections)
+
+    def close(self):
+        """Release the inference session"""
+        self._binding = None
+        self.session = None
@@ -8,10 +8,152 @@ import cv2
 import threading
 import time
 import json
+import re
+import struct
+import sys
 import tempfile
-import platform
 from pathlib import Path
 import os
+import platform
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    shared_memory = None
+    resource_tracker = None
+    SHARED_MEMORY_AVAILABLE = False
+
+# PyTurboJPEG calls libjpeg-turbo's SIMD kernels directly, independent of
+# whichever JPEG library OpenCV was built against
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    TJSAMP_420 = None
+    _turbo_jpeg = None
+
+# nvJPEG (pynvjpeg) runs the codec on a CUDA device, e.g. the Jetson's NVJPG engine
+try:
+    from nvjpeg import NvJpeg
+    _nv_jpeg = NvJpeg()
+except Exception:
+    _nv_jpeg = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Keys the webapp expects in every metadata payload
+_METADATA_DEFAULTS = {
+    'wave_detected': False,
+    'face_detected': False,
+    'tracking_state': 'unknown',
+    'antenna_mode': 'idle'
+}
+
+
+def _json_default(value):
+    """Serialize numpy scalars and anything else unexpected in frame metadata"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _dump_json(data):
+    """Serialize metadata to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(payload):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Tracker metadata has a fixed schema, so it travels as a packed record:
+# magic, flags (face_detected, wave_detected, has face_position, has
+# head_position), face x/y, head pan/roll/pitch, tracking state id, antenna
+# mode id. Anything outside the schema falls back to JSON; the magic byte
+# can never start a JSON document.
+_METADATA_MAGIC = 0xA5
+_METADATA_RECORD = struct.Struct('<BB5fBB')
+_TRACKING_STATES = ('unknown', 'idle', 'scanning', 'giving_up', 'sad', 'looking_down', 'waiting')
+_ANTENNA_MODES = ('idle', 'tracking', 'scanning', 'giving_up', 'sad')
+_TRACKING_STATE_IDS = {name: i for i, name in enumerate(_TRACKING_STATES)}
+_ANTENNA_MODE_IDS = {name: i for i, name in enumerate(_ANTENNA_MODES)}
+_PACKED_KEYS = frozenset((
+    'face_detected', 'wave_detected', 'face_position', 'head_position', 'tracking_state', 'antenna_mode'
+))
+
+
+def _pack_metadata(metadata):
+    """Pack tracker metadata into the fixed record, None if it does not fit the schema"""
+    if not metadata.keys() <= _PACKED_KEYS:
+        return None
+
+    state = _TRACKING_STATE_IDS.get(metadata.get('tracking_state', 'unknown'))
+    antenna = _ANTENNA_MODE_IDS.get(metadata.get('antenna_mode', 'idle'))
+    if state is None or antenna is None:
+        return None
+
+    flags = (1 if metadata.get('face_detected') else 0) | (2 if metadata.get('wave_detected') else 0)
+    face_x = face_y = pan = roll = pitch = 0.0
+    try:
+        face = metadata.get('face_position')
+        if face is not None:
+            flags |= 4
+            face_x, face_y = face['x'], face['y']
+
+        head = metadata.get('head_position')
+        if head is not None:
+            flags |= 8
+            pan, roll, pitch = head['pan'], head['roll'], head['pitch']
+
+        return _METADATA_RECORD.pack(_METADATA_MAGIC, flags, face_x, face_y, pan, roll, pitch,
+                                     state, antenna)
+    except (KeyError, TypeError, struct.error):
+        return None
+
+
+def _load_metadata(payload):
+    """Decode a metadata payload, packed record or JSON"""
+    if payload[0] == _METADATA_MAGIC and len(payload) == _METADATA_RECORD.size:
+        _, flags, face_x, face_y, pan, roll, pitch, state, antenna = _METADATA_RECORD.unpack(payload)
+        return {
+            'face_detected': bool(flags & 1),
+            'wave_detected': bool(flags & 2),
+            'face_position': {'x': face_x, 'y': face_y} if flags & 4 else None,
+            'head_position': {'pan': pan, 'roll': roll, 'pitch': pitch} if flags & 8 else None,
+            'tracking_state': _TRACKING_STATES[state],
+            'antenna_mode': _ANTENNA_MODES[antenna]
+        }
+    return _load_json(payload)
+
+
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Binary mode matters on Windows, where os.open defaults to text mode
+_FRAME_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | (os.O_BINARY if _IS_WINDOWS else 0)
+
+
+class _Slot:
+    """One entry of the in-process frame ring"""
+    __slots__ = ('frame', 'metadata', 'seq', 'timestamp')
+
+    def __init__(self):
+        self.frame = None
+        self.metadata = None
+        self.seq = 0
+        self.timestamp = 0.0
+
 
 # Suppress OpenCV warnings about missing files
 os.environ['OPENCV_LOG_LEVEL'] = 'ERROR'
@@ -21,20 +163,91 @@ cv2.setLogLevel(0)
 class CameraFrameProvider:
     """
     Shared frame provider that can be accessed by external applications.
-    Uses atomic writes to prevent partial frame reads.
-    Cross-platform support for Linux and Windows.
+    Frames are passed as raw BGR pixels through a double-buffered shared
+    memory region; the JPEG file path is only used when shared memory is
+    unavailable. Cross-platform support for Linux and Windows.
     """
 
-    # Use platform-appropriate temp directory
-    _TEMP_DIR = Path(tempfile.gettempdir()) / "reachy_frames"
-
-    FRAME_PATH = _TEMP_DIR / "reachy_camera_frame.jpg"
-    FRAME_TEMP_PATH = _TEMP_DIR / "reachy_camera_frame_temp.jpg"
-    METADATA_PATH = _TEMP_DIR / "reachy_camera_metadata.json"
+    # Prefer RAM-backed tmpfs on Linux, otherwise the platform temp directory
+    if sys.platform.startswith('linux') and Path('/dev/shm').is_dir():
+        _TEMP_DIR = Path('/dev/shm') / "reachy_frames"
+    else:
+        _TEMP_DIR = Path(tempfile.gettempdir()) / "reachy_frames"
+
+    # Fallback frame files, written alternately so readers always have one
+    # complete slot while the other is being overwritten
+    FRAME_SLOT_PATHS = (
+        _TEMP_DIR / "reachy_camera_frame_a.bin",
+        _TEMP_DIR / "reachy_camera_frame_b.bin"
+    )
+    _FRAME_SLOT_STRS = tuple(str(path) for path in FRAME_SLOT_PATHS)
+
+    # Touched by readers on the file transport so the publisher can tell someone is watching
+    READER_HEARTBEAT_PATH = _TEMP_DIR / "reachy_camera_reader"
+    _READER_HEARTBEAT_STR = str(READER_HEARTBEAT_PATH)
+
+    # Shared memory layout: header (seq, width, height, stride, active_slot,
+    # metadata_len, monotonic publish time, metadata timestamp) padded to 64
+    # bytes, followed by two slots. Each slot holds the metadata JSON followed
+    # by the raw frame. The per-frame metadata timestamp lives in the header
+    # so the JSON only changes when the tracking state does. Readers stamp
+    # their last read time into the header padding.
+    SHM_NAME = "reachy_frame"
+    _SHM_HEADER = struct.Struct('<QIIIIIdd')
+    _SHM_READER = struct.Struct('<d')
+    _SHM_READER_OFFSET = 48
+    _SHM_HEADER_SIZE = 64
+    _SHM_METADATA_SIZE = 4096
+    _SHM_STALE_AFTER = 2.0
+
+    # JPEG settings for the preview stream, tune per deployment
+    JPEG_QUALITY = 75
+    JPEG_CHROMA_QUALITY = 65
+
+    # Wider frames are downscaled before publishing, None publishes full size
+    PREVIEW_MAX_WIDTH = 640
 
-    _frame_lock = threading.Lock()
     _initialized = False
 
+    # Fallback frame record: (seq, metadata_len, timestamp) + metadata + JPEG + seq
+    _FILE_HEADER = struct.Struct('<QId')
+    _FILE_SEQ = struct.Struct('<Q')
+    _frame_fds = [None, None]
+    _frame_seq = 0
+
+    # Single-slot hand-off to the encoder thread, newer frames replace older ones
+    _encode_condition = threading.Condition()
+    _pending_frame = None
+    _encoder_thread = None
+    _encoder_running = False
+
+    # Per-thread output buffers reused by get_latest_frame
+    _frame_buffers = threading.local()
+
+    _shm = None
+    _shm_owner = False
+    _last_publish_ts = 0.0
+
+    # Last read by a reader in this process, and last heartbeat file touch
+    _last_read_ts = 0.0
+    _last_heartbeat_ts = 0.0
+
+    # In-process ring for readers living in the publisher's process
+    _slots = [_Slot(), _Slot()]
+    _active_slot = 0
+    _push_seq = 0
+
+    # Guards the in-process slots, so a reader never pairs one push's seq with
+    # another push's frame, and wakes readers blocked in wait_for_frame. Other
+    # processes poll the shared memory sequence at this interval instead.
+    _frame_condition = threading.Condition()
+    _FRAME_POLL_INTERVAL = 0.005
+
+    # Last serialized metadata (without timestamp), and what each shm slot holds
+    _last_metadata = None
+    _last_payload = b''
+    _slot_payloads = [None, None]
+
     @classmethod
     def _ensure_temp_dir(cls):
         """Ensure the temp directory exists"""
@@ -42,13 +255,78 @@ class CameraFrameProvider:
             try:
                 cls._TEMP_DIR.mkdir(parents=True, exist_ok=True)
                 cls._initialized = True
+                cls._check_jpeg_backend()
             except Exception as e:
                 print(f"Warning: Failed to create temp directory: {e}")
 
+    @classmethod
+    def _check_jpeg_backend(cls):
+        """Warn once if JPEG coding would fall back to a non-SIMD libjpeg"""
+        if _nv_jpeg is not None or _turbo_jpeg is not None:
+            return
+
+        try:
+            build_info = cv2.getBuildInformation()
+        except Exception:
+            return
+
+        jpeg_match = re.search(r'^\s*JPEG:\s*(.+)$', build_info, re.MULTILINE)
+        jpeg_backend = jpeg_match.group(1).strip() if jpeg_match else 'unknown'
+        simd_enabled = re.search(r'SIMD Support:\s*YES', build_info) is not None
+
+        if 'libjpeg-turbo' not in jpeg_backend or not simd_enabled:
+            print(f"Warning: OpenCV JPEG codec is not SIMD-enabled libjpeg-turbo ({jpeg_backend}). "
+                  "Install PyTurboJPEG or an OpenCV build with libjpeg-turbo for faster frame encoding")
+
+    @classmethod
+    def _encode_jpeg(cls, frame):
+        """
+        Encode a BGR frame to JPEG using 4:2:0 chroma subsampling
+
+        Returns:
+            bytes or None if encoding failed
+        """
+        if _nv_jpeg is not None:
+            try:
+                return _nv_jpeg.encode(frame, cls.JPEG_QUALITY)
+            except Exception:
+                pass
+
+        if _turbo_jpeg is not None:
+            return _turbo_jpeg.encode(frame, quality=cls.JPEG_QUALITY, jpeg_subsample=TJSAMP_420)
+
+        # No JPEG_OPTIMIZE - it costs a second Huffman pass
+        success, buffer = cv2.imencode('.jpg', frame, [
+            cv2.IMWRITE_JPEG_QUALITY, cls.JPEG_QUALITY,
+            cv2.IMWRITE_JPEG_CHROMA_QUALITY, cls.JPEG_CHROMA_QUALITY,
+            cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0
+        ])
+        return buffer.tobytes() if success else None
+
+    @staticmethod
+    def _decode_jpeg(data):
+        """
+        Decode JPEG bytes to a BGR frame
+
+        Returns:
+            numpy array or None if decoding failed
+        """
+        if _nv_jpeg is not None:
+            try:
+                return _nv_jpeg.decode(data)
+            except Exception:
+                pass
+
+        if _turbo_jpeg is not None:
+            return _turbo_jpeg.decode(data)
+
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+
     @classmethod
     def publish_frame(cls, frame, metadata=None):
         """
-        Publish a frame for external consumption with atomic write
+        Publish a frame for external consumption
 
         Args:
             frame: OpenCV frame (BGR format)
@@ -56,138 +334,516 @@ class CameraFrameProvider:
         """
         cls._ensure_temp_dir()
 
+        payload = b''
+        timestamp = 0.0
+        if metadata is not None:
+            static_metadata = dict(metadata)
+            timestamp = float(static_metadata.pop('timestamp', 0.0) or 0.0)
+
+            # Tracker metadata packs in a single struct call, other metadata goes
+            # through JSON and is reused while unchanged
+            packed = _pack_metadata(static_metadata)
+            if packed is not None:
+                payload = packed
+            elif static_metadata == cls._last_metadata:
+                payload = cls._last_payload
+            else:
+                try:
+                    payload = _dump_json({**_METADATA_DEFAULTS, **static_metadata})
+                    cls._last_metadata = static_metadata
+                    cls._last_payload = payload
+                except (TypeError, ValueError):
+                    # Silently ignore metadata errors
+                    pass
+
         try:
-            with cls._frame_lock:
-                # Write to a temporary file first
-                success = cv2.imwrite(
-                    str(cls.FRAME_TEMP_PATH),
-                    frame,
-                    [cv2.IMWRITE_JPEG_QUALITY, 85]
-                )
+            resized = False
+            height, width = frame.shape[:2]
+            if cls.PREVIEW_MAX_WIDTH and width > cls.PREVIEW_MAX_WIDTH:
+                scale = cls.PREVIEW_MAX_WIDTH / width
+                frame = cv2.resize(frame, (cls.PREVIEW_MAX_WIDTH, int(height * scale)),
+                                   interpolation=cv2.INTER_AREA)
+                resized = True
+
+            # One clock read stamps the in-process slot, the shm header and the publish time
+            now = time.monotonic()
+
+            # The shm writer copies the pixels into the segment itself. A frame kept
+            # past this call needs its own copy, as the caller may keep drawing on
+            # it, and a resized frame already is one.
+            owned = frame if resized else None
+            if (now - cls._last_read_ts) < cls._SHM_STALE_AFTER:
+                # Readers in this process hold on to the pushed frame
+                if owned is None:
+                    owned = frame.copy()
+                cls.push(owned, metadata, now)
+            elif cls._read_slot()[0] is not None:
+                # Nobody in this process reads frames any more, stop serving the last one
+                with cls._frame_condition:
+                    cls._slots = [_Slot(), _Slot()]
+
+            if not cls._write_shared_frame(frame, payload, timestamp, now):
+                # The encoder thread works on the frame after this call returns
+                cls._queue_frame_file(frame.copy() if owned is None else owned, payload, timestamp)
+            cls._last_publish_ts = now
+        except Exception as e:
+            # Silently ignore frame publish errors to avoid spam
+            pass
 
-                if not success:
-                    print("Warning: Failed to write frame")
-                    return
+    @classmethod
+    def push(cls, frame, metadata=None, now=None):
+        """
+        Store a reference to the frame for readers in this process. No copy or
+        encode is made, so the frame must not be modified after it is pushed.
+
+        Args:
+            frame: OpenCV frame (BGR format)
+            metadata: Optional dict with metadata about the frame
+            now: time.monotonic() of the push, read here if not given
+        """
+        timestamp = time.monotonic() if now is None else now
+        with cls._frame_condition:
+            next_slot = 1 - cls._active_slot
+            slot = cls._slots[next_slot]
+            cls._push_seq += 1
+            slot.frame = frame
+            slot.metadata = metadata
+            slot.seq = cls._push_seq
+            slot.timestamp = timestamp
+            cls._active_slot = next_slot
+            cls._frame_condition.notify_all()
 
-                # Windows-specific: Retry logic for file operations
-                max_retries = 3
-                retry_delay = 0.01  # 10ms
+    @classmethod
+    def _read_slot(cls):
+        """Latest push as (frame, metadata, seq, timestamp), all read under the slot lock"""
+        with cls._frame_condition:
+            slot = cls._slots[cls._active_slot]
+            return slot.frame, slot.metadata, slot.seq, slot.timestamp
 
-                for attempt in range(max_retries):
-                    try:
-                        # On Windows, delete the target first if it exists
-                        if platform.system() == 'Windows' and cls.FRAME_PATH.exists():
-                            try:
-                                cls.FRAME_PATH.unlink()
-                            except PermissionError:
-                                # File is locked, wait and retry
-                                if attempt < max_retries - 1:
-                                    time.sleep(retry_delay)
-                                    continue
-                                else:
-                                    # Last attempt failed, skip this frame
-                                    return
-
-                        # Atomic rename
-                        cls.FRAME_TEMP_PATH.rename(cls.FRAME_PATH)
-                        break  # Success!
-
-                    except (PermissionError, OSError) as e:
-                        if attempt < max_retries - 1:
-                            time.sleep(retry_delay)
-                            continue
-                        else:
-                            # Failed after all retries, skip this frame silently
-                            return
-
-                # Save metadata
-                if metadata is not None:
+    @classmethod
+    def peek(cls):
+        """
+        Get the most recently pushed frame without copying it
+
+        Returns:
+            (frame, metadata, seq) tuple or (None, None, 0) if nothing was pushed
+        """
+        frame, metadata, seq, _ = cls._read_slot()
+        return frame, metadata, seq
+
+    @classmethod
+    def _open_shared_memory(cls, size=0):
+        """
+        Create (publisher, size > 0) or attach to (consumer) the shared frame buffer
+
+        Returns:
+            SharedMemory or None if shared memory is unavailable
+        """
+        if cls._shm is not None:
+            if not size or cls._shm.size >= size:
+                return cls._shm
+            cls._close_shared_memory()
+
+        if not SHARED_MEMORY_AVAILABLE:
+            return None
+
+        try:
+            if size:
+                try:
+                    shm = shared_memory.SharedMemory(name=cls.SHM_NAME, create=True, size=size)
+                except FileExistsError:
+                    # Left over from a previous run - replace it if too small
+                    shm = shared_memory.SharedMemory(name=cls.SHM_NAME)
+                    if shm.size < size:
+                        shm.close()
+                        shm.unlink()
+                        shm = shared_memory.SharedMemory(name=cls.SHM_NAME, create=True, size=size)
+                cls._shm_owner = True
+                cls._slot_payloads = [None, None]
+            else:
+                shm = shared_memory.SharedMemory(name=cls.SHM_NAME)
+                # Consumers must not unlink the publisher's segment on exit
+                if not _IS_WINDOWS:
                     try:
-                        # Ensure all values are JSON serializable
-                        serializable_metadata = {}
-                        for key, value in metadata.items():
-                            if value is None:
-                                serializable_metadata[key] = None
-                            elif isinstance(value, (bool, int, float, str)):
-                                serializable_metadata[key] = value
-                            elif isinstance(value, dict):
-                                # Handle nested dicts (like face_position, head_position)
-                                serializable_metadata[key] = {
-                                    k: float(v) if v is not None and isinstance(v, (int, float)) else v
-                                    for k, v in value.items()
-                                }
-                            else:
-                                serializable_metadata[key] = str(value)
-
-                        # Ensure required keys exist with defaults
-                        serializable_metadata.setdefault('wave_detected', False)
-                        serializable_metadata.setdefault('face_detected', False)
-                        serializable_metadata.setdefault('tracking_state', 'unknown')
-                        serializable_metadata.setdefault('antenna_mode', 'idle')
-
-                        with open(cls.METADATA_PATH, 'w', encoding='utf-8') as f:
-                            json.dump(serializable_metadata, f, indent=2)
-                    except (TypeError, ValueError, OSError) as e:
-                        # Silently ignore metadata errors
+                        resource_tracker.unregister(shm._name, 'shared_memory')
+                    except Exception:
                         pass
+                cls._shm_owner = False
+        except (OSError, ValueError):
+            return None
 
-        except Exception as e:
-            # Silently ignore frame publish errors to avoid spam
+        cls._shm = shm
+        return shm
+
+    @classmethod
+    def _close_shared_memory(cls, unlink=False):
+        """Detach from the shared frame buffer"""
+        shm = cls._shm
+        cls._shm = None
+        if shm is None:
+            return
+        try:
+            shm.close()
+            if unlink:
+                shm.unlink()
+        except (OSError, BufferError):
             pass
 
+    @classmethod
+    def _write_shared_frame(cls, frame, payload=b'', timestamp=0.0, now=None):
+        """
+        Copy the frame and its metadata into the inactive shared memory slot,
+        then publish the header
+
+        Returns:
+            bool: True if the frame was written to shared memory
+        """
+        if frame.dtype != np.uint8 or frame.ndim != 3 or frame.shape[2] != 3:
+            return False
+
+        height, width = frame.shape[:2]
+        stride = width * 3
+        slot_size = cls._SHM_METADATA_SIZE + height * stride
+
+        shm = cls._open_shared_memory(cls._SHM_HEADER_SIZE + 2 * slot_size)
+        if shm is None:
+            return False
+
+        seq, _, _, _, active_slot, _, _, _ = cls._SHM_HEADER.unpack_from(shm.buf, 0)
+        slot = 1 - active_slot if seq else 0
+        slot_offset = cls._SHM_HEADER_SIZE + slot * slot_size
+
+        # Oversized metadata is dropped rather than spilling into the frame
+        if len(payload) > cls._SHM_METADATA_SIZE:
+            payload = b''
+        if cls._slot_payloads[slot] is not payload:
+            shm.buf[slot_offset:slot_offset + len(payload)] = payload
+            cls._slot_payloads[slot] = payload
+
+        target = np.ndarray(
+            (height, width, 3), dtype=np.uint8, buffer=shm.buf,
+            offset=slot_offset + cls._SHM_METADATA_SIZE
+        )
+        target[:] = frame
+        del target
+
+        # Header goes last so readers never see a half-written slot
+        cls._SHM_HEADER.pack_into(
+            shm.buf, 0, seq + 1, width, height, stride, slot, len(payload),
+            time.monotonic() if now is None else now, timestamp
+        )
+        return True
+
+    @classmethod
+    def _read_shared_frame(cls):
+        """
+        Copy the most recent frame and its metadata out of shared memory
+
+        Returns:
+            (frame, metadata_bytes, timestamp) tuple or (None, None, 0.0) if no frame is available
+        """
+        shm = cls._open_shared_memory()
+        if shm is None:
+            return None, None, 0.0
+
+        for _ in range(3):
+            header = cls._SHM_HEADER.unpack_from(shm.buf, 0)
+            seq, width, height, stride, slot, metadata_len, publish_ts, timestamp = header
+            if seq == 0:
+                return None, None, 0.0
+
+            slot_offset = cls._SHM_HEADER_SIZE + slot * (cls._SHM_METADATA_SIZE + height * stride)
+            offset = slot_offset + cls._SHM_METADATA_SIZE
+            if offset + height * stride > shm.size:
+                return None, None, 0.0
+
+            payload = bytes(shm.buf[slot_offset:slot_offset + metadata_len])
+            view = np.ndarray(
+                (height, width, 3), dtype=np.uint8, buffer=shm.buf,
+                offset=offset, strides=(stride, 3, 1)
+            )
+            frame = cls._get_frame_buffer(view.shape)
+            np.copyto(frame, view)
+            del view
+
+            # Retry if the publisher flipped slots while we were copying
+            if cls._SHM_HEADER.unpack_from(shm.buf, 0) == header:
+                break
+        else:
+            return None, None, 0.0
+
+        now = time.monotonic()
+        cls._SHM_READER.pack_into(shm.buf, cls._SHM_READER_OFFSET, now)
+        if now - publish_ts > cls._SHM_STALE_AFTER:
+            # Publisher may have restarted with a fresh segment, re-attach next time
+            cls._close_shared_memory()
+
+        return frame, payload, timestamp
+
+    @classmethod
+    def _get_frame_buffer(cls, shape):
+        """Return this thread's reusable output frame, reallocating only when the shape changes"""
+        frame = getattr(cls._frame_buffers, 'frame', None)
+        if frame is None or frame.shape != shape:
+            frame = np.empty(shape, dtype=np.uint8)
+            cls._frame_buffers.frame = frame
+        return frame
+
+    @classmethod
+    def _queue_frame_file(cls, frame, payload, timestamp):
+        """Hand the frame to the encoder thread, replacing any frame it has not picked up yet"""
+        with cls._encode_condition:
+            cls._pending_frame = (frame, payload, timestamp)
+            if cls._encoder_thread is None or not cls._encoder_thread.is_alive():
+                cls._encoder_running = True
+                cls._encoder_thread = threading.Thread(target=cls._encoder_loop, daemon=True)
+                cls._encoder_thread.start()
+            cls._encode_condition.notify()
+
+    @classmethod
+    def _encoder_loop(cls):
+        """Background thread that JPEG-encodes and writes queued frames"""
+        while True:
+            with cls._encode_condition:
+                cls._encode_condition.wait_for(
+                    lambda: cls._pending_frame is not None or not cls._encoder_running
+                )
+                if not cls._encoder_running:
+                    return
+                frame, payload, timestamp = cls._pending_frame
+                cls._pending_frame = None
+
+            try:
+                cls._write_frame_file(frame, payload, timestamp)
+            except Exception:
+                pass
+
+    @classmethod
+    def _stop_encoder(cls):
+        """Stop the encoder thread and drop any frame it has not written"""
+        with cls._encode_condition:
+            cls._encoder_running = False
+            cls._pending_frame = None
+            cls._encode_condition.notify()
+
+        if cls._encoder_thread is not None:
+            cls._encoder_thread.join(timeout=1.0)
+            cls._encoder_thread = None
+
+    @classmethod
+    def _write_frame_file(cls, frame, payload=b'', timestamp=0.0):
+        """
+        Fallback transport: JPEG-encode the frame in memory and overwrite the older
+        of the two slot files together with its metadata. The record is framed by the
+        same sequence number at both ends so readers can detect a torn read.
+
+        Returns:
+            bool: True if the frame was written
+        """
+        data = cls._encode_jpeg(frame)
+        if data is None:
+            print("Warning: Failed to encode frame")
+            return False
+
+        seq = cls._frame_seq + 1
+        slot = seq % 2
+
+        try:
+            fd = cls._frame_fds[slot]
+            if fd is None:
+                # Truncate on first open so slots left by a previous run never look newer
+                fd = os.open(cls._FRAME_SLOT_STRS[slot], _FRAME_FILE_FLAGS | os.O_TRUNC, 0o644)
+                cls._frame_fds[slot] = fd
+
+            record = b''.join((
+                cls._FILE_HEADER.pack(seq, len(payload), timestamp),
+                payload,
+                data,
+                cls._FILE_SEQ.pack(seq)
+            ))
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, record)
+            os.ftruncate(fd, len(record))
+            cls._frame_seq = seq
+            return True
+        except OSError:
+            # Skip this frame silently, the file is reopened on the next one
+            cls._close_frame_file()
+            return False
+
+    @classmethod
+    def _close_frame_file(cls):
+        """Close the fallback frame file descriptors"""
+        for slot, fd in enumerate(cls._frame_fds):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                cls._frame_fds[slot] = None
+
+    @classmethod
+    def _read_slot_seq(cls, path):
+        """Read the sequence number at the start of a slot file, 0 if unreadable"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(cls._FILE_HEADER.size)
+        except OSError:
+            return 0
+        if len(header) < cls._FILE_HEADER.size:
+            return 0
+        return cls._FILE_HEADER.unpack(header)[0]
+
+    @classmethod
+    def _read_frame_file(cls):
+        """
+        Fallback transport: read the newest complete JPEG frame and its metadata from disk
+
+        Returns:
+            (frame, metadata_bytes, timestamp) tuple or (None, None, 0.0) if no frame is available
+        """
+        # Newest slot first, the older one is still complete if the writer lapped us
+        slots = sorted(
+            ((cls._read_slot_seq(path), path) for path in cls._FRAME_SLOT_STRS),
+            reverse=True
+        )
+
+        header_size = cls._FILE_HEADER.size
+        seq_size = cls._FILE_SEQ.size
+
+        # Temporarily disable OpenCV error output
+        old_log_level = cv2.getLogLevel()
+        cv2.setLogLevel(0)
+
+        try:
+            for slot_seq, path in slots:
+                if not slot_seq:
+                    continue
+                try:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+
+                    if len(data) <= header_size + seq_size:
+                        continue
+
+                    seq, metadata_len, timestamp = cls._FILE_HEADER.unpack_from(data, 0)
+                    trailer_seq, = cls._FILE_SEQ.unpack_from(data, len(data) - seq_size)
+
+                    # Mismatched sequence numbers mean the writer was mid-frame
+                    if seq != trailer_seq:
+                        continue
+
+                    frame = cls._decode_jpeg(data[header_size + metadata_len:-seq_size])
+                    if frame is not None:
+                        return frame, data[header_size:header_size + metadata_len], timestamp
+                except Exception:
+                    continue
+        finally:
+            cv2.setLogLevel(old_log_level)
+
+        return None, None, 0.0
+
     @classmethod
     def get_latest_frame(cls):
         """
-        Get the latest published frame (call this from your webapp)
+        Get the latest published frame (call this from your webapp).
+        The returned frame is shared with the publisher or reused by the next
+        call from the same thread, copy it if you need to modify it or keep it
+        across frames.
 
         Returns:
             (frame, metadata) tuple or (None, None) if no frame available
         """
+        # Publisher in this process, hand out the pushed frame directly. The read
+        # is recorded either way so the publisher starts pushing for this reader.
+        frame, metadata, _, pushed_at = cls._read_slot()
+        now = time.monotonic()
+        cls._last_read_ts = now
+        if frame is not None and (now - pushed_at) < cls._SHM_STALE_AFTER:
+            return frame, ({**_METADATA_DEFAULTS, **metadata} if metadata is not None else None)
+
         cls._ensure_temp_dir()
 
         try:
-            with cls._frame_lock:
-                if not cls.FRAME_PATH.exists():
-                    return None, None
-
-                # Read frame with error suppression and retry logic
-                max_retries = 3
-                retry_delay = 0.01  # 10ms
-                frame = None
+            frame, payload, timestamp = cls._read_shared_frame()
+            if frame is None:
+                frame, payload, timestamp = cls._read_frame_file()
+                cls._touch_reader_heartbeat()
 
-                # Temporarily disable OpenCV error output
-                old_log_level = cv2.getLogLevel()
-                cv2.setLogLevel(0)
+            if frame is None:
+                return None, None
 
+            # Metadata travels in the same record as the frame
+            metadata = None
+            if payload:
                 try:
-                    for attempt in range(max_retries):
-                        try:
-                            frame = cv2.imread(str(cls.FRAME_PATH))
-                            if frame is not None:
-                                break
-                        except Exception:
-                            if attempt < max_retries - 1:
-                                time.sleep(retry_delay)
-                            continue
-                finally:
-                    cv2.setLogLevel(old_log_level)
-
-                if frame is None:
-                    return None, None
-
-                # Read metadata if exists
-                metadata = None
-                if cls.METADATA_PATH.exists():
-                    try:
-                        with open(cls.METADATA_PATH, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    except (json.JSONDecodeError, IOError, PermissionError):
-                        metadata = None
+                    metadata = _load_metadata(payload)
+                    if timestamp:
+                        metadata['timestamp'] = timestamp
+                except (ValueError, IndexError):
+                    metadata = None
 
-                return frame.copy(), metadata
+            return frame, metadata
         except Exception:
             return None, None
 
+    @classmethod
+    def get_frame_seq(cls):
+        """
+        Sequence number of the latest published frame, cheap enough to poll
+        before get_latest_frame() so readers can skip copying a frame they already have
+
+        Returns:
+            int: Frame sequence number, or 0 if unknown (file fallback or stale publisher)
+        """
+        # Publisher in this process
+        frame, _, seq, pushed_at = cls._read_slot()
+        if frame is not None and (time.monotonic() - pushed_at) < cls._SHM_STALE_AFTER:
+            return seq
+
+        # Publisher in another process, only the header is read
+        shm = cls._open_shared_memory()
+        if shm is None:
+            return 0
+        header = cls._SHM_HEADER.unpack_from(shm.buf, 0)
+        seq, publish_ts = header[0], header[-2]
+        if time.monotonic() - publish_ts > cls._SHM_STALE_AFTER:
+            # Let get_latest_frame() re-attach if the publisher restarted
+            return 0
+        return seq
+
+    @classmethod
+    def wait_for_frame(cls, last_seq=0, timeout=1.0):
+        """
+        Block until a frame newer than last_seq has been published
+
+        Args:
+            last_seq: Sequence number of the frame the caller already has
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            int: Latest sequence number, equal to last_seq on timeout and 0 if
+            the transport has no sequence number (file fallback)
+        """
+        deadline = time.monotonic() + timeout
+        seq = cls.get_frame_seq()
+        while seq and seq == last_seq:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            # Publisher in this process notifies, otherwise poll the shm header
+            if cls._read_slot()[0] is not None:
+                with cls._frame_condition:
+                    cls._frame_condition.wait_for(
+                        lambda: cls._slots[cls._active_slot].seq != last_seq, remaining
+                    )
+            else:
+                time.sleep(min(cls._FRAME_POLL_INTERVAL, remaining))
+            seq = cls.get_frame_seq()
+        return seq
+
     @classmethod
     def is_available(cls):
         """
@@ -196,32 +852,91 @@ class CameraFrameProvider:
         Returns:
             bool: True if frames are available and recent
         """
+        # Publisher in this process
+        if (time.monotonic() - cls._last_publish_ts) < 2.0:
+            return True
+
+        # Publisher in another process, the monotonic clock is shared host-wide
+        shm = cls._open_shared_memory()
+        if shm is not None:
+            header = cls._SHM_HEADER.unpack_from(shm.buf, 0)
+            seq, publish_ts = header[0], header[-2]
+            if seq and (time.monotonic() - publish_ts) < cls._SHM_STALE_AFTER:
+                return True
+
         cls._ensure_temp_dir()
 
-        if not cls.FRAME_PATH.exists():
-            return False
+        # Check if a slot file was modified recently (within the last 2 seconds)
+        for path in cls._FRAME_SLOT_STRS:
+            try:
+                if (time.time() - os.stat(path).st_mtime) < 2.0:
+                    return True
+            except OSError:
+                continue
+        return False
 
-        # Check if the file was modified recently (within the last 2 seconds)
+    @classmethod
+    def _touch_reader_heartbeat(cls):
+        """Mark the file transport as watched, at most twice a second"""
+        now = time.monotonic()
+        if now - cls._last_heartbeat_ts < 0.5:
+            return
+        cls._last_heartbeat_ts = now
         try:
-            mtime = cls.FRAME_PATH.stat().st_mtime
-            return (time.time() - mtime) < 2.0
-        except Exception:
+            os.utime(cls._READER_HEARTBEAT_STR)
+        except FileNotFoundError:
+            try:
+                cls.READER_HEARTBEAT_PATH.touch()
+            except OSError:
+                pass
+        except OSError:
+            pass
+
+    @classmethod
+    def has_subscribers(cls):
+        """
+        Check if anyone has read a frame recently (call this from the publisher)
+
+        Returns:
+            bool: True if a reader fetched a frame within the last 2 seconds
+        """
+        now = time.monotonic()
+
+        # Reader in this process
+        if (now - cls._last_read_ts) < cls._SHM_STALE_AFTER:
+            return True
+
+        # Reader in another process stamps our shared memory header
+        shm = cls._shm
+        if shm is not None:
+            reader_ts, = cls._SHM_READER.unpack_from(shm.buf, cls._SHM_READER_OFFSET)
+            if reader_ts and (now - reader_ts) < cls._SHM_STALE_AFTER:
+                return True
+
+        # Reader on the file transport
+        try:
+            return (time.time() - os.stat(cls._READER_HEARTBEAT_STR).st_mtime) < cls._SHM_STALE_AFTER
+        except OSError:
             return False
 
     @classmethod
     def cleanup(cls):
-        """Clean up published frame files"""
+        """Clean up published frame files and the shared frame buffer"""
+        cls._close_shared_memory(unlink=cls._shm_owner)
+        cls._shm_owner = False
+        with cls._frame_condition:
+            cls._slots = [_Slot(), _Slot()]
+        cls._stop_encoder()
+        cls._close_frame_file()
+
         max_retries = 3
         retry_delay = 0.1
 
         for attempt in range(max_retries):
             try:
-                if cls.FRAME_PATH.exists():
-                    cls.FRAME_PATH.unlink()
-                if cls.FRAME_TEMP_PATH.exists():
-                    cls.FRAME_TEMP_PATH.unlink()
-                if cls.METADATA_PATH.exists():
-                    cls.METADATA_PATH.unlink()
+                for path in (*cls.FRAME_SLOT_PATHS, cls.READER_HEARTBEAT_PATH):
+                    if path.exists():
+                        path.unlink()
 
                 # Try to remove the temp directory if empty
                 try:
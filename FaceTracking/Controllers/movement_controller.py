@@ -8,6 +8,11 @@ import random
 import threading
 from abc import ABC, abstractmethod
 
+_random = random.random
+
+# Antenna droop used by the "giving_up" animation
+_GIVING_UP_POSITIONS = tuple(range(0, -21, -2))
+
 
 class MovementController(ABC):
     """Abstract base class for movement control"""
@@ -47,6 +52,13 @@ class ReachyMovementController(MovementController):
         from reachy_sdk.trajectory.interpolation import InterpolationMode
 
         self.reachy = ReachySDK(reachy_host)
+
+        # Joint handles used on the tracking hot path
+        self._yaw = self.reachy.head.neck_yaw
+        self._roll = self.reachy.head.neck_roll
+        self._pitch = self.reachy.head.neck_pitch
+        self._la = self.reachy.head.l_antenna
+        self._ra = self.reachy.head.r_antenna
         self.goto = goto
         self.InterpolationMode = InterpolationMode
         self.enable_antenna = enable_antenna
@@ -58,6 +70,7 @@ class ReachyMovementController(MovementController):
 
         # Antenna control
         self.current_antenna_mode = "idle"
+        self._mode_condition = threading.Condition()
         if self.enable_antenna:
             self.antenna_thread_running = True
             self.antenna_thread = threading.Thread(target=self._antenna_controller, daemon=True)
@@ -69,22 +82,30 @@ class ReachyMovementController(MovementController):
         self.current_roll = roll
         self.current_pitch = pitch
 
-        self.reachy.head.neck_yaw.goal_position = pan
-        self.reachy.head.neck_roll.goal_position = roll
-        self.reachy.head.neck_pitch.goal_position = pitch
+        self._set_head(pan, roll, pitch)
+
+    def _set_head(self, pan, roll, pitch):
+        """Write all neck goals back to back so the SDK ships them in one sync batch"""
+        self._yaw.goal_position = pan
+        self._roll.goal_position = roll
+        self._pitch.goal_position = pitch
+
+    def _set_antennas(self, left, right):
+        """Write both antenna goals back to back so the SDK ships them in one sync batch"""
+        self._la.goal_position = left
+        self._ra.goal_position = right
 
     def get_current_position(self):
         """Get current head position from Reachy"""
-        return (
-            self.reachy.head.neck_yaw.present_position,
-            self.reachy.head.neck_roll.present_position,
-            self.reachy.head.neck_pitch.present_position
-        )
+        return self._yaw.present_position, self._roll.present_position, self._pitch.present_position
 
     def set_antenna_mode(self, mode):
         """Set antenna animation mode"""
         if self.enable_antenna:
-            self.current_antenna_mode = mode
+            with self._mode_condition:
+                if mode != self.current_antenna_mode:
+                    self.current_antenna_mode = mode
+                    self._mode_condition.notify_all()
 
     def turn_on(self):
         """Turn on Reachy's head"""
@@ -101,17 +122,19 @@ class ReachyMovementController(MovementController):
 
         # Stop antenna thread
         if self.enable_antenna:
-            self.antenna_thread_running = False
+            with self._mode_condition:
+                self.antenna_thread_running = False
+                self._mode_condition.notify_all()
             self.antenna_thread.join(timeout=2)
 
         # Return to neutral position
         self.goto(
             goal_positions={
-                self.reachy.head.neck_yaw: 0,
-                self.reachy.head.neck_roll: 0,
-                self.reachy.head.neck_pitch: 0,
-                self.reachy.head.l_antenna: 0,
-                self.reachy.head.r_antenna: 0
+                self._yaw: 0,
+                self._roll: 0,
+                self._pitch: 0,
+                self._la: 0,
+                self._ra: 0
             },
             duration=1.0,
             interpolation_mode=self.InterpolationMode.MINIMUM_JERK
@@ -120,49 +143,60 @@ class ReachyMovementController(MovementController):
 
         self.reachy.turn_off_smoothly('head')
 
+    def _hold(self, mode, timeout=None):
+        """
+        Wait until the timeout elapses, the antenna mode changes or the thread stops
+
+        Returns:
+            bool: True if the animation for mode should continue
+        """
+        with self._mode_condition:
+            interrupted = self._mode_condition.wait_for(
+                lambda: not self.antenna_thread_running or self.current_antenna_mode != mode,
+                timeout=timeout
+            )
+        return not interrupted
+
     def _antenna_controller(self):
         """Background thread to control antenna movements"""
         while self.antenna_thread_running:
+            mode = self.current_antenna_mode
             try:
-                if self.current_antenna_mode == "sad":
-                    self.reachy.head.l_antenna.goal_position = -125
-                    self.reachy.head.r_antenna.goal_position = 125
-                    time.sleep(0.3)
-                    self.reachy.head.l_antenna.goal_position = -120
-                    self.reachy.head.r_antenna.goal_position = 120
-
-                elif self.current_antenna_mode == "tracking":
+                if mode == "sad":
+                    self._set_antennas(-125, 125)
+                    if self._hold(mode, 0.3):
+                        self._set_antennas(-120, 120)
+
+                elif mode == "tracking":
                     base_left = -15
                     base_right = 15
-                    wiggle = random.uniform(-15, 15)
+                    wiggle = _random() * 30.0 - 15.0
 
-                    self.reachy.head.l_antenna.goal_position = base_left + wiggle
-                    self.reachy.head.r_antenna.goal_position = base_right - wiggle
-                    time.sleep(random.uniform(0.3, 0.8))
+                    self._set_antennas(base_left + wiggle, base_right - wiggle)
+                    self._hold(mode, 0.3 + _random() * 0.5)
 
-                elif self.current_antenna_mode == "idle":
-                    self.reachy.head.l_antenna.goal_position = 0
-                    self.reachy.head.r_antenna.goal_position = 0
-                    time.sleep(0.5)
+                elif mode == "idle":
+                    # Hold the rest position until something else is requested
+                    self._set_antennas(0, 0)
+                    self._hold(mode)
 
-                elif self.current_antenna_mode == "scanning":
+                elif mode == "scanning":
                     for _ in range(2):
-                        if not self.antenna_thread_running or self.current_antenna_mode != "scanning":
+                        self._set_antennas(-125, 125)
+                        if not self._hold(mode, 0.3):
                             break
-                        self.reachy.head.l_antenna.goal_position = -125
-                        self.reachy.head.r_antenna.goal_position = 125
-                        time.sleep(0.3)
-                        self.reachy.head.l_antenna.goal_position = -100
-                        self.reachy.head.r_antenna.goal_position = 100
-                        time.sleep(0.3)
-
-                elif self.current_antenna_mode == "giving_up":
-                    for pos in range(0, -21, -2):
-                        if not self.antenna_thread_running or self.current_antenna_mode != "giving_up":
+                        self._set_antennas(-100, 100)
+                        if not self._hold(mode, 0.3):
                             break
-                        self.reachy.head.l_antenna.goal_position = -pos
-                        self.reachy.head.r_antenna.goal_position = pos
-                        time.sleep(0.1)
+
+                elif mode == "giving_up":
+                    for pos in _GIVING_UP_POSITIONS:
+                        self._set_antennas(-pos, pos)
+                        if not self._hold(mode, 0.1):
+                            break
+
+                else:
+                    self._hold(mode)
 
             except Exception as e:
                 print(f"Antenna error: {e}")
@@ -187,7 +221,7 @@ class SimulatedMovementController(MovementController):
         self.current_roll = roll
         self.current_pitch = pitch
         # Print occasional updates (not every frame)
-        if random.random() < 0.05:  # 5% of frames
+        if _random() < 0.05:  # 5% of frames
             print(f"[SIM] Head: pan={pan:.1f}, roll={roll:.1f}, pitch={pitch:.1f}")
 
     def get_current_position(self):
@@ -4,28 +4,106 @@ Can work with webcam or Reachy camera
 """
 
 import random
-from collections import deque
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import hypot
 
 import cv2 as cv
 import mediapipe as mp
 import numpy as np
 
+try:
+    from Controllers._kernels import NUMBA_AVAILABLE, analyze_wave
+except ImportError:
+    from FaceTracking.Controllers._kernels import NUMBA_AVAILABLE, analyze_wave
+
 # Initialize MediaPipe
 mp_face_detection = mp.solutions.face_detection
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 
 
+@lru_cache(maxsize=64)
+def _window_bounds(length, window):
+    """Start/end indices and sizes of the centered windows, shrunk at the edges"""
+    index = np.arange(length)
+    starts = np.maximum(index - window // 2, 0)
+    ends = np.minimum(index + window // 2 + 1, length)
+    return starts, ends, (ends - starts)[:, np.newaxis].astype(np.float64)
+
+
 def _smooth_positions(positions, window=3):
-    """Apply moving average smoothing"""
-    smoothed = []
-    for i in range(len(positions)):
-        start = max(0, i - window // 2)
-        end = min(len(positions), i + window // 2 + 1)
-        avg_x = sum(p[0] for p in positions[start:end]) / (end - start)
-        avg_y = sum(p[1] for p in positions[start:end]) / (end - start)
-        smoothed.append((avg_x, avg_y))
-    return smoothed
+    """
+    Apply moving average smoothing
+
+    Returns:
+        (N, 2) array of smoothed (x, y) positions
+    """
+    points = np.asarray(positions, dtype=np.float64)
+    starts, ends, sizes = _window_bounds(len(points), window)
+
+    # Windowed sums from a prefix sum, one pass regardless of the window size
+    csum = np.zeros((len(points) + 1, 2))
+    np.cumsum(points, axis=0, out=csum[1:])
+    return (csum[ends] - csum[starts]) / sizes
+
+
+class FrameGrabber:
+    """
+    Wraps a cv2.VideoCapture, grabbing frames continuously in the background
+    and decoding only the ones that are actually read. Frames the tracker is
+    too slow for are dropped before the decode.
+    """
+
+    def __init__(self, capture):
+        self.capture = capture
+        self._condition = threading.Condition()
+        self._wanted = threading.Event()
+        self._frame = None
+        self._running = True
+        # Cameras can take seconds to deliver their first frame, read() waits for it without a timeout
+        self._started = False
+        # The capture is only touched from this thread, VideoCapture is not thread safe
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+
+    def _grab_loop(self):
+        while self._running:
+            if not self.capture.grab():
+                time.sleep(0.01)
+                continue
+
+            if self._wanted.is_set():
+                ret, frame = self.capture.retrieve()
+                with self._condition:
+                    self._frame = (ret, frame)
+                    self._wanted.clear()
+                    self._condition.notify_all()
+
+    def read(self, timeout=1.0):
+        """Decode the next grabbed frame, same return as VideoCapture.read()"""
+        with self._condition:
+            self._frame = None
+            self._wanted.set()
+            self._condition.wait_for(lambda: self._frame is not None or not self._running,
+                                     timeout if self._started else None)
+            result = self._frame
+            if result is not None and result[0]:
+                self._started = True
+        return result if result is not None else (False, None)
+
+    def isOpened(self):
+        return self._running and self.capture.isOpened()
+
+    def release(self):
+        """Stop grabbing and release the capture"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+        self.capture.release()
 
 
 class WaveDetector:
@@ -39,8 +117,13 @@ class WaveDetector:
             min_tracking_confidence=0.5
         )
 
-        # Track wrist positions over time
-        self.wrist_positions = deque(maxlen=buffer_size)
+        # Track wrist positions over time in a ring buffer. Every sample is stored twice,
+        # buffer_size rows apart, so the last buffer_size samples are always one
+        # contiguous, oldest-first slice
+        self.buffer_size = buffer_size
+        self._wrist_buf = np.zeros((2 * buffer_size, 2))
+        self._wrist_write = 0
+        self._wrist_count = 0
 
         # Movement thresholds (relaxed for better detection)
         self.wave_threshold = 0.06
@@ -56,6 +139,10 @@ class WaveDetector:
         # Smoothing
         self.smoothing_window = 3
 
+        # Compile the wave kernel now rather than on the first hand
+        if NUMBA_AVAILABLE:
+            self._analyze_points(np.zeros((self.min_wave_duration, 2)))
+
     def detect_wave(self, image_rgb):
         """
         Detect waving motion in frame
@@ -66,7 +153,25 @@ class WaveDetector:
         Returns:
             (wave_detected, hand_landmarks_list)
         """
-        results = self.hands.process(image_rgb)
+        return self.analyze(self.process_raw(image_rgb))
+
+    def process_raw(self, image_rgb):
+        """
+        Run MediaPipe Hands on the frame, the first half of detect_wave for
+        callers that overlap it with other work
+
+        Returns:
+            MediaPipe Hands results, to be passed to analyze()
+        """
+        return self.hands.process(image_rgb)
+
+    def analyze(self, results):
+        """
+        Update the wrist history from MediaPipe Hands results and check for a wave
+
+        Returns:
+            (wave_detected, hand_landmarks_list)
+        """
         wave_detected = False
         hand_landmarks_list = []
 
@@ -76,62 +181,73 @@ class WaveDetector:
 
                 # Get wrist position (landmark 0)
                 wrist = hand_landmarks.landmark[0]
-                self.wrist_positions.append((wrist.x, wrist.y))
+                self._add_wrist_position(wrist.x, wrist.y)
 
                 # Check for waving motion
-                if len(self.wrist_positions) >= self.min_wave_duration:
+                if self._wrist_count >= self.min_wave_duration:
                     wave_detected = self._analyze_wave_motion()
         else:
             # Clear buffer if no hand detected
-            self.wrist_positions.clear()
+            self._wrist_count = 0
 
         return wave_detected, hand_landmarks_list
 
+    def _add_wrist_position(self, x, y):
+        """Append a wrist sample, overwriting the oldest once the buffer is full"""
+        index = self._wrist_write
+        self._wrist_buf[index] = self._wrist_buf[index + self.buffer_size] = (x, y)
+        self._wrist_write = (index + 1) % self.buffer_size
+        self._wrist_count = min(self._wrist_count + 1, self.buffer_size)
+
+    def _wrist_history(self):
+        """View of the buffered wrist samples, oldest first"""
+        end = self._wrist_write + self.buffer_size
+        return self._wrist_buf[end - self._wrist_count:end]
+
     def _analyze_wave_motion(self):
         """Analyze if the wrist movement pattern represents a wave"""
-        if len(self.wrist_positions) < self.min_wave_duration:
+        if self._wrist_count < self.min_wave_duration:
             return False
 
         # Check temporal constraint
-        if len(self.wrist_positions) > self.max_wave_duration:
+        if self._wrist_count > self.max_wave_duration:
             return False
 
-        positions = list(self.wrist_positions)
+        return self._analyze_points(self._wrist_history())
+
+    def _analyze_points(self, points):
+        """Check an oldest-first (N, 2) wrist track for a wave"""
+        if NUMBA_AVAILABLE:
+            return analyze_wave(
+                points, self.smoothing_window, self.movement_threshold, self.vertical_threshold,
+                self.min_wave_speed, self.wave_threshold, self.min_waves
+            )
 
         # Apply smoothing to reduce noise
-        smoothed_positions = _smooth_positions(positions, self.smoothing_window)
-        x_coords = [p[0] for p in smoothed_positions]
-        y_coords = [p[1] for p in smoothed_positions]
+        smoothed_positions = _smooth_positions(points, self.smoothing_window)
+        x_coords = smoothed_positions[:, 0]
+        y_coords = smoothed_positions[:, 1]
+        if x_coords.size < 3:
+            return False
 
         # Check vertical movement (should be minimal for horizontal wave)
-        y_range = max(y_coords) - min(y_coords)
-        if y_range > self.vertical_threshold:
+        if np.ptp(y_coords) > self.vertical_threshold:
             return False
 
-        # Calculate velocities
-        velocities = [abs(x_coords[i + 1] - x_coords[i]) for i in range(len(x_coords) - 1)]
-        avg_velocity = sum(velocities) / len(velocities) if velocities else 0
-
         # Require minimum speed for wave motion
-        if avg_velocity < self.min_wave_speed:
+        deltas = np.diff(x_coords)
+        speeds = np.abs(deltas)
+        if speeds.mean() < self.min_wave_speed:
             return False
 
-        # Detect direction changes in horizontal movement with a threshold
-        direction_changes = 0
-        for i in range(1, len(x_coords) - 1):
-            prev_delta = x_coords[i] - x_coords[i - 1]
-            next_delta = x_coords[i + 1] - x_coords[i]
-
-            # Only count significant movements
-            if abs(prev_delta) > self.movement_threshold and abs(next_delta) > self.movement_threshold:
-                if prev_delta * next_delta < 0:  # Sign change
-                    direction_changes += 1
-
-        # Check total horizontal movement range
-        x_range = max(x_coords) - min(x_coords)
+        # Detect direction changes in horizontal movement, counting only significant movements
+        significant = speeds > self.movement_threshold
+        direction_changes = np.count_nonzero(
+            (deltas[:-1] * deltas[1:] < 0) & significant[:-1] & significant[1:]
+        )
 
         # Wave detected if enough horizontal movement and direction changes
-        return x_range > self.wave_threshold and direction_changes >= self.min_waves
+        return np.ptp(x_coords) > self.wave_threshold and direction_changes >= self.min_waves
 
     def cleanup(self):
         """Clean up resources"""
@@ -147,9 +263,10 @@ class ROIController:
         self.frame_center_x = frame_width / 2
         self.frame_center_y = frame_height / 2
 
-        # ROI parameters - SMALLER for quicker response
+        # ROI parameters - SMALLER for quicker response (change through set_roi_ratio)
         self.roi_width_ratio = 0.40  # Reduced from 0.60
         self.roi_height_ratio = 0.35  # Reduced from 0.50
+        self._roi_bounds = self._compute_roi_bounds()
 
         # Movement control - FASTER response
         self.last_movement_time = 0
@@ -161,7 +278,13 @@ class ROIController:
         self.smoothed_error_x = 0
         self.smoothed_error_y = 0
 
-    def get_roi_bounds(self):
+    def set_roi_ratio(self, width_ratio, height_ratio):
+        """Change the ROI size relative to the frame and refresh the cached bounds"""
+        self.roi_width_ratio = width_ratio
+        self.roi_height_ratio = height_ratio
+        self._roi_bounds = self._compute_roi_bounds()
+
+    def _compute_roi_bounds(self):
         """Calculate ROI boundaries around the frame center"""
         roi_w = int(self.frame_width * self.roi_width_ratio)
         roi_h = int(self.frame_height * self.roi_height_ratio)
@@ -173,9 +296,13 @@ class ROIController:
 
         return x1, y1, x2, y2
 
+    def get_roi_bounds(self):
+        """ROI boundaries around the frame center"""
+        return self._roi_bounds
+
     def is_in_roi(self, face_x, face_y):
         """Check if face is within the ROI dead zone"""
-        x1, y1, x2, y2 = self.get_roi_bounds()
+        x1, y1, x2, y2 = self._roi_bounds
         return x1 <= face_x <= x2 and y1 <= face_y <= y2
 
     def calculate_movement(self, face_x, face_y, current_time, movement_gain=75):  # Increased from 50
@@ -196,7 +323,7 @@ class ROIController:
         pan_adjustment = -self.smoothed_error_x * movement_gain
         roll_adjustment = -self.smoothed_error_y * movement_gain
 
-        movement_magnitude = np.sqrt(pan_adjustment ** 2 + roll_adjustment ** 2)
+        movement_magnitude = hypot(pan_adjustment, roll_adjustment)
         if movement_magnitude < self.min_movement_threshold:
             return None
 
@@ -207,7 +334,7 @@ class ROIController:
     def draw_debug_overlay(self, frame, face_x=None, face_y=None, hand_landmarks_list=None, wave_detected=False):
         """Draw ROI, tracking info, and hand landmarks for debugging"""
         # Draw ROI
-        x1, y1, x2, y2 = self.get_roi_bounds()
+        x1, y1, x2, y2 = self._roi_bounds
         cv.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
 
         # Draw center crosshair
@@ -246,6 +373,14 @@ class ROIController:
 class TrackingController:
     """Handles camera input and face detection logic"""
 
+    # No-face states that end after a fixed time: (duration, antenna mode while waiting)
+    TIMED_STATES = {
+        "giving_up": (1.5, "idle"),
+        "sad": (2.0, "sad"),
+        "looking_down": (3.0, "sad"),
+        "waiting": (2.0, "sad"),
+    }
+
     def __init__(self, camera_source, show_overlay=True):
         """
         Initialize tracking controller
@@ -257,6 +392,8 @@ class TrackingController:
         self.reachy = None
         self.camera_source = camera_source
         self.show_overlay = show_overlay
+        # Cleared by the owner while nobody looks at the frames, skips overlay drawing
+        self.overlay_requested = True
         self.is_reachy_camera = (camera_source == 'reachy')
 
         # Get frame dimensions
@@ -281,6 +418,10 @@ class TrackingController:
         # Hand wave detection
         self.wave_detector = WaveDetector(buffer_size=30)
 
+        # Face detection runs here while hand detection runs on the calling thread,
+        # MediaPipe releases the GIL during inference
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-detect")
+
         # Tracking state
         self.frame_count = 0
         self.no_face_count = 0
@@ -292,6 +433,30 @@ class TrackingController:
         self.MAX_SCANS = 1
         self.state_start_time = 0
 
+        # Timed states skip the state machine entirely until their deadline
+        self._next_transition_time = 0.0
+        self._timed_antenna_mode = "idle"
+        self._no_face_handlers = {
+            "idle": self._no_face_idle,
+            "scanning": self._no_face_scanning,
+            "giving_up": self._no_face_giving_up,
+            "sad": self._no_face_sad,
+            "looking_down": self._no_face_looking_down,
+            "waiting": self._no_face_waiting,
+        }
+
+        # Detection runs on a downscaled frame, results are relative so they map back unchanged
+        self.detect_scale = 0.5
+
+        # Detection buffers shared by both detectors, refilled in place every frame
+        self._small_buf = None
+        self._rgb_buf = None
+
+        # Ping-pong display frames for the Reachy camera, so the frame returned last
+        # call stays intact while the next one is drawn
+        self._display_bufs = [None, None]
+        self._display_index = 0
+
     def set_reachy_camera(self, reachy):
         """Set up Reachy camera after initialization"""
         self.reachy = reachy
@@ -323,15 +488,33 @@ class TrackingController:
         if image is None:
             return None
 
-        # Process for face and hand detection
-        image.flags.writeable = False
-        image_rgb = cv.cvtColor(image, cv.COLOR_BGR2RGB)
-
-        # Face detection
-        face_results = self.face_detection.process(image_rgb)
+        # Process for face and hand detection on a smaller copy, shrinking before the
+        # color swap so it touches fewer bytes. MediaPipe needs contiguous RGB, so a
+        # reversed channel view won't do; convert into the reused buffer instead
+        small = image
+        if self.detect_scale < 1.0:
+            height, width = image.shape[:2]
+            small_shape = (max(1, round(height * self.detect_scale)),
+                           max(1, round(width * self.detect_scale)), 3)
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=np.uint8)
+            small = cv.resize(image, (small_shape[1], small_shape[0]), dst=self._small_buf,
+                              interpolation=cv.INTER_AREA)
+
+        if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+            self._rgb_buf = np.empty_like(small)
+        image_rgb = self._rgb_buf
+        image_rgb.flags.writeable = True
+        cv.cvtColor(small, cv.COLOR_BGR2RGB, dst=image_rgb)
+        image_rgb.flags.writeable = False
+
+        # Face and hand detection in parallel
+        face_future = self._pool.submit(self.face_detection.process, image_rgb)
+        hand_results = self.wave_detector.process_raw(image_rgb)
+        face_results = face_future.result()
 
         # Hand wave detection
-        wave_detected, hand_landmarks_list = self.wave_detector.detect_wave(image_rgb)
+        wave_detected, hand_landmarks_list = self.wave_detector.analyze(hand_results)
 
         face_x, face_y = None, None
         face_detected = False
@@ -342,7 +525,7 @@ class TrackingController:
             face_detected = True
             self.no_face_count = 0
             self.scan_count = 0
-            self.scanning_state = "idle"
+            self._enter_state("idle", current_time)
             antenna_mode = "tracking"
 
             detection = face_results.detections[0]
@@ -368,9 +551,10 @@ class TrackingController:
             self.no_face_count += 1
             movement_command, antenna_mode = self._handle_no_face(current_time)
 
-        # Prepare display frame
-        display_frame = image.copy()
-        if self.show_overlay:
+        # Prepare display frame. Webcam reads return a fresh array we can draw on,
+        # the Reachy camera may hand out the same frame again on the next call
+        display_frame = self._copy_display_frame(image) if self.is_reachy_camera else image
+        if self.show_overlay and self.overlay_requested:
             display_frame = self.roi_controller.draw_debug_overlay(
                 display_frame, face_x, face_y, hand_landmarks_list, wave_detected
             )
@@ -388,87 +572,99 @@ class TrackingController:
             'antenna_mode': antenna_mode
         }
 
+    def _copy_display_frame(self, image):
+        """Copy the frame into the next of the two reused display buffers"""
+        self._display_index ^= 1
+        frame = self._display_bufs[self._display_index]
+        if frame is None or frame.shape != image.shape:
+            frame = self._display_bufs[self._display_index] = np.empty_like(image)
+        np.copyto(frame, image)
+        return frame
+
+    def _enter_state(self, state, current_time):
+        """Switch the scanning state, arming the deadline of timed states"""
+        self.scanning_state = state
+        self.state_start_time = current_time
+        timed = self.TIMED_STATES.get(state)
+        if timed is not None:
+            duration, self._timed_antenna_mode = timed
+            self._next_transition_time = current_time + duration
+        else:
+            self._next_transition_time = 0.0
+
     def _handle_no_face(self, current_time):
         """Handle scanning behavior when no face is detected"""
-        movement_command = None
-        antenna_mode = "idle"
-
-        if self.scanning_state == "idle":
-            if self.no_face_count >= 60:
-                self.scanning_state = "scanning"
-                self.scan_count = 0
-                self.state_start_time = current_time
-                antenna_mode = "scanning"
-            else:
-                antenna_mode = "idle"
-
-        elif self.scanning_state == "scanning":
-            antenna_mode = "scanning"
-
-            if self.frame_count % 90 == 0:
-                self.scan_count += 1
-
-                if self.scan_count > self.MAX_SCANS:
-                    self.scanning_state = "giving_up"
-                    self.state_start_time = current_time
-                    antenna_mode = "giving_up"
-                else:
-                    random_pan_magnitude = random.uniform(30, 75)
-                    random_roll = random.uniform(-5, 5)
-
-                    if self.PANLEFT:
-                        random_pan = -random_pan_magnitude
-                    else:
-                        random_pan = random_pan_magnitude
-
-                    self.PANLEFT = not self.PANLEFT
-
-                    movement_command = {
-                        'type': 'absolute',
-                        'pan': random_pan,
-                        'roll': random_roll,
-                        'pitch': 0
-                    }
-
-        elif self.scanning_state == "giving_up":
-            if current_time - self.state_start_time > 1.5:
-                self.scanning_state = "sad"
-                self.state_start_time = current_time
-                antenna_mode = "sad"
-
-        elif self.scanning_state == "sad":
-            antenna_mode = "sad"
-
-            if current_time - self.state_start_time > 2.0:
-                self.scanning_state = "looking_down"
-                self.state_start_time = current_time
-                movement_command = {
-                    'type': 'absolute',
-                    'pan': 0,
-                    'roll': -30,
-                    'pitch': 0
-                }
+        # Nothing can change before a timed state runs out
+        if current_time <= self._next_transition_time:
+            return None, self._timed_antenna_mode
+
+        handler = self._no_face_handlers.get(self.scanning_state)
+        if handler is None:
+            return None, "idle"
+        return handler(current_time)
+
+    def _no_face_idle(self, current_time):
+        if self.no_face_count >= 60:
+            self._enter_state("scanning", current_time)
+            self.scan_count = 0
+            return None, "scanning"
+        return None, "idle"
+
+    def _no_face_scanning(self, current_time):
+        if self.frame_count % 90 != 0:
+            return None, "scanning"
+
+        self.scan_count += 1
+        if self.scan_count > self.MAX_SCANS:
+            self._enter_state("giving_up", current_time)
+            return None, "giving_up"
+
+        random_pan_magnitude = random.uniform(30, 75)
+        random_roll = random.uniform(-5, 5)
 
-        elif self.scanning_state == "looking_down":
-            antenna_mode = "sad"
+        if self.PANLEFT:
+            random_pan = -random_pan_magnitude
+        else:
+            random_pan = random_pan_magnitude
+
+        self.PANLEFT = not self.PANLEFT
 
-            if current_time - self.state_start_time > 3.0:
-                self.scanning_state = "waiting"
-                self.state_start_time = current_time
+        movement_command = {
+            'type': 'absolute',
+            'pan': random_pan,
+            'roll': random_roll,
+            'pitch': 0
+        }
+        return movement_command, "scanning"
 
-        elif self.scanning_state == "waiting":
-            antenna_mode = "sad"
+    # The timed handlers only run once their deadline has passed
 
-            if current_time - self.state_start_time > 2.0:
-                self.scanning_state = "scanning"
-                self.scan_count = 0
-                self.state_start_time = current_time
-                antenna_mode = "scanning"
+    def _no_face_giving_up(self, current_time):
+        self._enter_state("sad", current_time)
+        return None, "sad"
 
-        return movement_command, antenna_mode
+    def _no_face_sad(self, current_time):
+        self._enter_state("looking_down", current_time)
+        movement_command = {
+            'type': 'absolute',
+            'pan': 0,
+            'roll': -30,
+            'pitch': 0
+        }
+        return movement_command, "sad"
+
+    def _no_face_looking_down(self, current_time):
+        self._enter_state("waiting", current_time)
+        return None, "sad"
+
+    def _no_face_waiting(self, current_time):
+        self._enter_state("scanning", current_time)
+        self.scan_count = 0
+        return None, "scanning"
 
     def cleanup(self):
         """Clean up resources"""
+        self._pool.shutdown(wait=True)
         self.face_detection.close()
         self.wave_detector.cleanup()
         if not self.is_reachy_camera:
@@ -3,16 +3,36 @@ Main Face Tracking Application
 Supports both webcam testing and Reachy robot control
 """
 
+import argparse
 import cv2
+import numpy as np
+import threading
 import time
-from Controllers.tracking_controller import TrackingController
+from Controllers.tracking_controller import TrackingController, FrameGrabber
 from Controllers.movement_controller import SimulatedMovementController, ReachyMovementController
 from Controllers.frame_publisher import CameraFrameProvider
+from Controllers._kernels import NUMBA_AVAILABLE, step_head
 
 
 class FaceTrackingSystem:
     """Main system that coordinates tracking and movement"""
 
+    # The control thread interpolates and moves the head at this rate, independent of tracking
+    CONTROL_HZ = 100
+    # INTERPOLATION_RATE is the fraction covered per frame at this rate
+    INTERPOLATION_FPS = 30
+    # Skip head commands until the interpolated position drifts this far (degrees) from the last one sent
+    MOVE_EPSILON = 0.3
+    # Smaller changes are still sent once this long (seconds) has passed since the last move
+    MOVE_HEARTBEAT = 0.1
+    # Rows at the bottom of the frame covered by the status text
+    STATUS_STRIP_HEIGHT = 40
+
+    # Publish rate for watched frames, the webapp does not render faster than this
+    PUBLISH_HZ = 30
+    # Publish interval while no reader is watching, keeps is_available() true for new readers
+    IDLE_PUBLISH_INTERVAL = 0.5
+
     def __init__(self, use_reachy=False, camera_id=1, show_window=True, publish_frames=False):
         """
         Initialize the face tracking system
@@ -43,20 +63,32 @@ class FaceTrackingSystem:
             if not cap.isOpened():
                 raise RuntimeError(f"Could not open camera {camera_id}")
 
+            # Keep only the newest frame queued, and let the camera send MJPEG if it can
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            cap = FrameGrabber(cap)
+
             self.movement_controller = SimulatedMovementController(enable_antenna=True)
             self.tracking_controller = TrackingController(cap, show_overlay=True)
 
         # Position tracking with smooth interpolation - FASTER for quicker response
-        self.target_pan = 0
-        self.target_roll = 0
-        self.target_pitch = 0
-        self.current_pan = 0
-        self.current_roll = 0
-        self.current_pitch = 0
+        # (pan, roll, pitch) arrays so the control loop updates all three at once
+        self.target = np.zeros(3)
+        self.current = np.zeros(3)
+        self.last_sent = np.zeros(3)
         self.INTERPOLATION_RATE = 0.5  # Increased from 0.3 for faster response
 
         # State
         self.running = False
+        self.control_thread = None
+        self._target_lock = threading.Lock()
+
+        # Status text mask, re-rendered only when the status changes
+        self._status_key = None
+        self._status_mask = None
+
+        self._last_publish_time = 0.0
+        self._last_wave_time = 0.0
 
     def start(self):
         """Start the tracking system"""
@@ -68,26 +100,92 @@ class FaceTrackingSystem:
         self.movement_controller.turn_on()
 
         # Get initial positions
-        self.current_pan, self.current_roll, self.current_pitch = \
-            self.movement_controller.get_current_position()
-        self.target_pan = self.current_pan
-        self.target_roll = self.current_roll
-        self.target_pitch = self.current_pitch
+        self.current[:] = self.movement_controller.get_current_position()
+        self.target[:] = self.current
+        self.last_sent[:] = self.current
+
+        # Compile the control kernel now rather than on the first control tick
+        if NUMBA_AVAILABLE:
+            step_head(np.zeros(3), np.zeros(3), np.zeros(3), 0.0, self.MOVE_EPSILON, False)
 
         print("\nSystem ready!")
         print("- Face tracking active")
         print("- Hand wave detection active")
         if self.publish_frames:
-            temp_dir = CameraFrameProvider.get_temp_directory()
-            print(f"- Publishing frames to {temp_dir / 'reachy_camera_frame.jpg'}")
-        print("- Press 'q' to quit")
+            print(f"- Publishing frames to shared memory '{CameraFrameProvider.SHM_NAME}'")
         if self.show_window:
+            print("- Press 'q' to quit")
             print("- Press 'o' to toggle overlay")
+        else:
+            print("- Press Ctrl+C to quit")
         print()
 
         self.running = True
+        self.control_thread = threading.Thread(target=self._control_loop, daemon=True)
+        self.control_thread.start()
         self._main_loop()
 
+    def _control_loop(self):
+        """Interpolate toward the latest targets and move the head at CONTROL_HZ"""
+        period = 1.0 / self.CONTROL_HZ
+        rate = 1.0 - (1.0 - self.INTERPOLATION_RATE) ** (self.INTERPOLATION_FPS / self.CONTROL_HZ)
+        current, last_sent = self.current, self.last_sent
+        delta = np.empty(3)
+        next_tick = last_move = now = time.monotonic()
+
+        while self.running:
+            try:
+                flush = now - last_move >= self.MOVE_HEARTBEAT
+                with self._target_lock:
+                    if NUMBA_AVAILABLE:
+                        moved = step_head(current, self.target, last_sent, rate, self.MOVE_EPSILON, flush)
+                    else:
+                        np.subtract(self.target, current, out=delta)
+                        delta *= rate
+                        current += delta
+                        np.subtract(current, last_sent, out=delta)
+                        moved = np.abs(delta).max() > (0.0 if flush else self.MOVE_EPSILON)
+                        if moved:
+                            last_sent[:] = current
+
+                # Head commands go over the network, keep them off the tracking thread
+                # and skip them while the head is holding still
+                if moved:
+                    self.movement_controller.move_head(*current.tolist())
+                    last_move = now
+            except Exception as e:
+                print(f"Control error: {e}")
+
+            next_tick += period
+            now = time.monotonic()
+            delay = next_tick - now
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = now
+
+    def _draw_status(self, frame, tracking_data):
+        """Stamp the status line onto the bottom of the frame"""
+        key = (tracking_data['scanning_state'], tracking_data['face_detected'],
+               tracking_data['wave_detected'], frame.shape[1])
+        if key != self._status_key:
+            status_text = f"State: {tracking_data['scanning_state']}"
+            if tracking_data['face_detected']:
+                status_text += " | Face: DETECTED"
+            else:
+                status_text += " | Face: NOT FOUND"
+
+            if tracking_data['wave_detected']:
+                status_text += " | WAVING"
+
+            strip = np.zeros((self.STATUS_STRIP_HEIGHT, frame.shape[1]), dtype=np.uint8)
+            cv2.putText(strip, status_text, (10, self.STATUS_STRIP_HEIGHT - 20),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+            self._status_mask = (strip > 0)[:, :, None]
+            self._status_key = key
+
+        np.copyto(frame[-self.STATUS_STRIP_HEIGHT:], 255, where=self._status_mask)
+
     def _main_loop(self):
         """Main processing loop"""
         show_overlay = True
@@ -96,6 +194,12 @@ class FaceTrackingSystem:
             while self.running:
                 current_time = time.time()
 
+                # Only draw the overlay when someone will see it
+                if not self.show_window:
+                    self.tracking_controller.overlay_requested = (
+                        self.publish_frames and CameraFrameProvider.has_subscribers()
+                    )
+
                 # Get tracking data
                 tracking_data = self.tracking_controller.process_frame(current_time)
 
@@ -110,21 +214,21 @@ class FaceTrackingSystem:
                     if cmd['type'] == 'adjust':
                         # Relative adjustment
                         actual_pan, actual_roll, _ = self.movement_controller.get_current_position()
-                        self.target_pan = actual_pan + cmd['pan_adjustment']
-                        self.target_roll = actual_roll + cmd['roll_adjustment']
-                        self.target_pitch = cmd['pitch']
+                        with self._target_lock:
+                            self.target[:] = (actual_pan + cmd['pan_adjustment'],
+                                              actual_roll + cmd['roll_adjustment'],
+                                              cmd['pitch'])
 
                     elif cmd['type'] == 'absolute':
                         # Absolute positioning
-                        self.target_pan = cmd['pan']
-                        self.target_roll = cmd['roll']
-                        self.target_pitch = cmd['pitch']
+                        with self._target_lock:
+                            self.target[:] = (cmd['pan'], cmd['roll'], cmd['pitch'])
 
                 # Handle wave detection
                 if tracking_data.get('wave_command') == 'wave_back':
                     # TODO: Trigger wave animation
                     # For now, just log it
-                    if not hasattr(self, '_last_wave_time') or (current_time - self._last_wave_time) > 3.0:
+                    if current_time - self._last_wave_time > 3.0:
                         print("[WAVE] Wave detected! Triggering wave response...")
                         self._last_wave_time = current_time
                         # self.movement_controller.wave_back()  # To be implemented
@@ -132,29 +236,23 @@ class FaceTrackingSystem:
                 # Update antenna mode
                 self.movement_controller.set_antenna_mode(tracking_data['antenna_mode'])
 
-                # Smooth interpolation
-                self.current_pan += (self.target_pan - self.current_pan) * self.INTERPOLATION_RATE
-                self.current_roll += (self.target_roll - self.current_roll) * self.INTERPOLATION_RATE
-                self.current_pitch += (self.target_pitch - self.current_pitch) * self.INTERPOLATION_RATE
-
-                # Send positions to movement controller
-                self.movement_controller.move_head(
-                    self.current_pan,
-                    self.current_roll,
-                    self.current_pitch
-                )
-
-                # Publish frame if enabled
-                if self.publish_frames:
+                # Publish frame if enabled, frames faster than PUBLISH_HZ are replaced before
+                # anyone reads them, and with nobody watching only stay discoverable
+                since_publish = current_time - self._last_publish_time
+                if (self.publish_frames and since_publish >= 1.0 / self.PUBLISH_HZ
+                        and (since_publish >= self.IDLE_PUBLISH_INTERVAL
+                             or CameraFrameProvider.has_subscribers())):
+                    self._last_publish_time = current_time
+                    pan, roll, pitch = self.current.tolist()
                     metadata = {
                         'timestamp': current_time,
                         'face_detected': tracking_data['face_detected'],
                         'face_position': tracking_data['face_position'],
                         'wave_detected': tracking_data['wave_detected'],
                         'head_position': {
-                            'pan': float(self.current_pan),
-                            'roll': float(self.current_roll),
-                            'pitch': float(self.current_pitch)
+                            'pan': pan,
+                            'roll': roll,
+                            'pitch': pitch
                         },
                         'tracking_state': tracking_data['scanning_state'],
                         'antenna_mode': tracking_data['antenna_mode']
@@ -166,17 +264,7 @@ class FaceTrackingSystem:
                     frame = tracking_data['frame']
 
                     # Add status text
-                    status_text = f"State: {tracking_data['scanning_state']}"
-                    if tracking_data['face_detected']:
-                        status_text += " | Face: DETECTED"
-                    else:
-                        status_text += " | Face: NOT FOUND"
-
-                    if tracking_data['wave_detected']:
-                        status_text += " | WAVING"
-
-                    cv2.putText(frame, status_text, (10, frame.shape[0] - 20),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                    self._draw_status(frame, tracking_data)
 
                     cv2.imshow('Face Tracking', frame)
 
@@ -199,6 +287,8 @@ class FaceTrackingSystem:
         """Stop the tracking system"""
         print("\nStopping tracking system...")
         self.running = False
+        if self.control_thread is not None:
+            self.control_thread.join(timeout=2)
 
         # Cleanup
         self.tracking_controller.cleanup()
@@ -214,11 +304,17 @@ class FaceTrackingSystem:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Face Tracking System")
+    parser.add_argument('--show-window', action='store_true',
+                        help="Show the local preview window (off by default, the webapp "
+                             "displays the published frames)")
+    args = parser.parse_args()
+
     try:
         system = FaceTrackingSystem(
             use_reachy=False,
             camera_id=0,
-            show_window=True,
+            show_window=args.show_window,
             publish_frames=True
         )
         system.start()
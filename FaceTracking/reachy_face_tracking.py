@@ -11,6 +11,7 @@ Usage:
 Your webapp can then access frames via CameraFrameProvider.get_latest_frame()
 """
 
+import argparse
 import random
 import cv2 as cv
 import mediapipe as mp
@@ -21,89 +22,26 @@ import time
 import threading
 import numpy as np
 from pathlib import Path
-import json
+
+# Frames are published through the shared-memory provider used by the rest of FaceTracking
+try:
+    from Controllers.frame_publisher import CameraFrameProvider
+    from Controllers._kernels import calc_move
+    from Controllers.face_detector import (
+        OnnxFaceDetection, ONNXRUNTIME_AVAILABLE, DEFAULT_MODEL_PATH, ACCEL_PROVIDERS
+    )
+except ImportError:
+    from FaceTracking.Controllers.frame_publisher import CameraFrameProvider
+    from FaceTracking.Controllers._kernels import calc_move
+    from FaceTracking.Controllers.face_detector import (
+        OnnxFaceDetection, ONNXRUNTIME_AVAILABLE, DEFAULT_MODEL_PATH, ACCEL_PROVIDERS
+    )
 
 # Initialize MediaPipe Face Detection
 mp_face_detection = mp.solutions.face_detection
 mp_drawing = mp.solutions.drawing_utils
 
 
-class CameraFrameProvider:
-    """
-    Shared frame provider that can be accessed by external applications.
-    Uses atomic writes to prevent partial frame reads.
-    """
-    FRAME_PATH = Path("/tmp/reachy_camera_frame.jpg")
-    FRAME_TEMP_PATH = Path("/tmp/reachy_camera_frame_temp.jpg")
-    METADATA_PATH = Path("/tmp/reachy_camera_metadata.json")
-
-    _frame_lock = threading.Lock()
-
-    @classmethod
-    def publish_frame(cls, frame, metadata=None):
-        """Publish a frame for external consumption with atomic write"""
-        try:
-            with cls._frame_lock:
-                # Write to a temporary file first
-                success = cv.imwrite(
-                    str(cls.FRAME_TEMP_PATH),
-                    frame,
-                    [cv.IMWRITE_JPEG_QUALITY, 85]
-                )
-
-                if not success:
-                    return
-
-                # Atomic rename (prevents reading partial files)
-                cls.FRAME_TEMP_PATH.rename(cls.FRAME_PATH)
-
-                # Save metadata
-                if metadata is not None:
-                    with open(cls.METADATA_PATH, 'w') as f:
-                        json.dump(metadata, f)
-
-        except Exception as e:
-            print(f"Error publishing frame: {e}")
-
-    @classmethod
-    def get_latest_frame(cls):
-        """Get the latest published frame (call this from your webapp)"""
-        try:
-            with cls._frame_lock:
-                if not cls.FRAME_PATH.exists():
-                    return None, None
-
-                # Read frame
-                frame = cv.imread(str(cls.FRAME_PATH))
-
-                if frame is None:
-                    return None, None
-
-                # Read metadata if exists
-                metadata = None
-                if cls.METADATA_PATH.exists():
-                    with open(cls.METADATA_PATH, 'r') as f:
-                        metadata = json.load(f)
-
-                return frame.copy(), metadata
-        except Exception as e:
-            print(f"Error reading frame: {e}")
-            return None, None
-
-    @classmethod
-    def is_available(cls):
-        """Check if frames are being published"""
-        if not cls.FRAME_PATH.exists():
-            return False
-
-        # Check if the file was modified recently (within the last 2 seconds)
-        try:
-            mtime = cls.FRAME_PATH.stat().st_mtime
-            return (time.time() - mtime) < 2.0
-        except Exception:
-            return False
-
-
 class FaceTrackingController:
     """ROI-based tracking controller to minimize jitter and unnecessary movements"""
 
@@ -113,22 +51,34 @@ class FaceTrackingController:
         self.frame_height = frame_height
         self.frame_center_x = frame_width / 2
         self.frame_center_y = frame_height / 2
+        self._inv_w = 1.0 / frame_width
+        self._inv_h = 1.0 / frame_height
 
-        # ROI parameters (configurable)
+        # ROI parameters (configurable through set_roi_ratio)
         self.roi_width_ratio = 0.60
         self.roi_height_ratio = 0.50
+        self._roi_bounds = self._compute_roi_bounds()
 
         # Movement control
         self.last_movement_time = 0
         self.movement_interval = 0.1
         self.min_movement_threshold = 1.0
+        self._min_movement_threshold_sq = self.min_movement_threshold ** 2
 
-        # Smoothing
+        # Smoothing, [error_x, error_y] so the movement kernel can update it in place
         self.smoothing_factor = 0.7
-        self.smoothed_error_x = 0
-        self.smoothed_error_y = 0
+        self.smoothed_error = np.zeros(2, dtype=np.float64)
 
-    def get_roi_bounds(self):
+        # Compile the movement kernel now rather than on the first detected face
+        calc_move(0.0, 0.0, 0.0, 0.0, 1.0, 1.0, np.zeros(2, dtype=np.float64), 0.0, 0.0, 0.0)
+
+    def set_roi_ratio(self, width_ratio, height_ratio):
+        """Change the ROI size relative to the frame and refresh the cached bounds"""
+        self.roi_width_ratio = width_ratio
+        self.roi_height_ratio = height_ratio
+        self._roi_bounds = self._compute_roi_bounds()
+
+    def _compute_roi_bounds(self):
         """Calculate ROI boundaries around the frame center"""
         roi_w = int(self.frame_width * self.roi_width_ratio)
         roi_h = int(self.frame_height * self.roi_height_ratio)
@@ -140,9 +90,13 @@ class FaceTrackingController:
 
         return x1, y1, x2, y2
 
+    def get_roi_bounds(self):
+        """ROI boundaries around the frame center"""
+        return self._roi_bounds
+
     def is_in_roi(self, face_x, face_y):
         """Check if face is within the ROI dead zone"""
-        x1, y1, x2, y2 = self.get_roi_bounds()
+        x1, y1, x2, y2 = self._roi_bounds
         return x1 <= face_x <= x2 and y1 <= face_y <= y2
 
     def calculate_movement(self, face_x, face_y, current_time, movement_gain=50):
@@ -153,18 +107,14 @@ class FaceTrackingController:
         if self.is_in_roi(face_x, face_y):
             return None
 
-        error_x = (face_x - self.frame_center_x) / self.frame_width
-        error_y = (face_y - self.frame_center_y) / self.frame_height
-
-        alpha = 1 - self.smoothing_factor
-        self.smoothed_error_x = alpha * error_x + self.smoothing_factor * self.smoothed_error_x
-        self.smoothed_error_y = alpha * error_y + self.smoothing_factor * self.smoothed_error_y
-
-        pan_adjustment = -self.smoothed_error_x * movement_gain
-        roll_adjustment = -self.smoothed_error_y * movement_gain
-
-        movement_magnitude = np.sqrt(pan_adjustment ** 2 + roll_adjustment ** 2)
-        if movement_magnitude < self.min_movement_threshold:
+        pan_adjustment, roll_adjustment, moved = calc_move(
+            float(face_x), float(face_y),
+            self.frame_center_x, self.frame_center_y,
+            self._inv_w, self._inv_h,
+            self.smoothed_error, self.smoothing_factor,
+            float(movement_gain), float(self._min_movement_threshold_sq)
+        )
+        if not moved:
             return None
 
         self.last_movement_time = current_time
@@ -196,7 +146,24 @@ class FaceTrackingController:
 class ReachyFaceTracker:
     """Main face tracking system that runs independently"""
 
-    def __init__(self, reachy_host='localhost', show_overlay=True, enable_antenna=True):
+    # Input resolution of the MediaPipe BlazeFace model
+    DETECTION_SIZE = (256, 256)
+
+    # Publish rate for watched frames, the webapp does not render faster than this
+    PUBLISH_HZ = 30
+    # Publish interval while no reader is watching, keeps is_available() true for new readers
+    IDLE_PUBLISH_INTERVAL = 0.5
+
+    # Goal changes smaller than this (degrees) are not sent to the robot
+    GOAL_EPSILON = 0.01
+
+    # The control thread interpolates and sends goals at this rate, independent of detection
+    CONTROL_HZ = 100
+    # INTERPOLATION_RATE is the fraction covered per frame at this rate
+    INTERPOLATION_FPS = 30
+
+    def __init__(self, reachy_host='localhost', show_overlay=True, enable_antenna=True,
+                 face_model_path=DEFAULT_MODEL_PATH, accel='cpu', camera_url=None):
         """
         Initialize face tracker
         
@@ -204,25 +171,37 @@ class ReachyFaceTracker:
             reachy_host: Reachy SDK host address
             show_overlay: Whether to draw debug overlay on camera feed
             enable_antenna: Whether to enable antenna animations
+            face_model_path: BlazeFace ONNX model, MediaPipe is used if it is missing
+            accel: Accelerator for the ONNX model ('cpu', 'qnn', 'openvino', 'nnapi')
+            camera_url: Optional V4L2 device index/path or RTSP URL of the head camera,
+                read directly instead of through the SDK camera stream
         """
         self.reachy = ReachySDK(reachy_host)
+        self._yaw = self.reachy.head.neck_yaw
+        self._roll = self.reachy.head.neck_roll
+        self._pitch = self.reachy.head.neck_pitch
+        self._la = self.reachy.head.l_antenna
+        self._ra = self.reachy.head.r_antenna
+        self._last_goal = (None, None, None)
         self.show_overlay = show_overlay
         self.enable_antenna = enable_antenna
 
         # Camera parameters
-        test_img = self.reachy.left_camera.last_frame
+        self.capture = self._open_capture(camera_url) if camera_url is not None else None
+        test_img = self._read_frame()
+        if test_img is None and self.capture is not None:
+            print("Warning: Camera stream returned no frame, using the SDK camera")
+            self.capture.release()
+            self.capture = None
+            test_img = self._read_frame()
         self.frame_height, self.frame_width = test_img.shape[:2]
 
         # Initialize tracking controller
         self.tracker = FaceTrackingController(self.frame_width, self.frame_height)
 
-        # Position tracking
-        self.target_pan = 0
-        self.target_roll = 0
-        self.target_pitch = 0
-        self.current_pan = 0
-        self.current_roll = 0
-        self.current_pitch = 0
+        # Position tracking, [pan, roll, pitch] vectors updated in one fused op
+        self._target = np.zeros(3)
+        self._current = np.zeros(3)
         self.INTERPOLATION_RATE = 0.3
 
         # Face tracking state
@@ -236,92 +215,285 @@ class ReachyFaceTracker:
         self.MAX_SCANS = 1
         self.state_start_time = 0
 
-        # Antenna control
+        # Antenna control, the thread sleeps on the condition until the mode changes
         self.current_antenna_mode = "idle"
+        self._antenna_condition = threading.Condition()
+        self._last_antennas = None
+        self.antenna_thread_running = False
         if self.enable_antenna:
             self.antenna_thread_running = True
             self.antenna_thread = threading.Thread(target=self._antenna_controller, daemon=True)
             self.antenna_thread.start()
 
         # Face detection
-        self.face_detection = mp_face_detection.FaceDetection(
+        self.face_detection = self._create_face_detection(face_model_path, accel)
+        if hasattr(self.face_detection, 'input_size'):
+            # The ONNX model takes a fixed square tensor
+            self.detection_size = self.face_detection.input_size
+        else:
+            # MediaPipe letterboxes internally, so keep the aspect ratio and fit within 256x256
+            self.det_scale = min(self.DETECTION_SIZE[0] / self.frame_width,
+                                 self.DETECTION_SIZE[1] / self.frame_height)
+            self.detection_size = (max(1, round(self.frame_width * self.det_scale)),
+                                   max(1, round(self.frame_height * self.det_scale)))
+
+        # The ONNX detector folds the BGR->RGB swap into its normalization,
+        # MediaPipe needs a real RGB image
+        self._detect_bgr = hasattr(self.face_detection, 'process_bgr')
+
+        # Detector input buffers reused every frame
+        det_w, det_h = self.detection_size
+        self._det_buf = np.empty((det_h, det_w, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty((det_h, det_w, 3), dtype=np.uint8)
+
+        # Frame publishing, the overlay is drawn into a reusable buffer
+        self._overlay_buf = None
+        self._last_publish_time = 0.0
+
+        # Latest-wins hand-off from detection to the publish thread
+        self._publish_condition = threading.Condition()
+        self._publish_item = None
+
+        # Guards _target and _current. Held by the control thread while it writes goals,
+        # and by the detection thread around target updates and goto
+        self._head_lock = threading.Lock()
+
+        # Detection, control and publish threads
+        self.tracking_thread_running = False
+        self.tracking_thread = None
+        self.control_thread = None
+        self.publish_thread = None
+
+    @staticmethod
+    def _open_capture(camera_url):
+        """Open the camera stream once, keeping only the newest frame buffered"""
+        source = int(camera_url) if str(camera_url).isdigit() else camera_url
+        backend = cv.CAP_ANY if isinstance(source, int) else cv.CAP_FFMPEG
+        capture = cv.VideoCapture(source, backend)
+        if not capture.isOpened():
+            print(f"Warning: Could not open camera stream {camera_url}, using the SDK camera")
+            return None
+
+        capture.set(cv.CAP_PROP_BUFFERSIZE, 1)
+        return capture
+
+    def _read_frame(self):
+        """Latest BGR camera frame, or None if none is available"""
+        if self.capture is not None:
+            ok, image = self.capture.read()
+            return image if ok else None
+        return self.reachy.left_camera.last_frame
+
+    @staticmethod
+    def _create_face_detection(face_model_path, accel='cpu'):
+        """Prefer the quantized BlazeFace ONNX model, fall back to MediaPipe"""
+        if ONNXRUNTIME_AVAILABLE and face_model_path is not None and Path(face_model_path).exists():
+            try:
+                detector = OnnxFaceDetection(face_model_path, min_detection_confidence=0.9, accel=accel)
+                print(f"Using ONNX face detector ({accel}): {face_model_path}")
+                return detector
+            except Exception as e:
+                print(f"Warning: Failed to load ONNX face detector, using MediaPipe: {e}")
+
+        return mp_face_detection.FaceDetection(
             model_selection=1,
             min_detection_confidence=0.9
         )
 
-        # Tracking thread
-        self.tracking_thread_running = False
-        self.tracking_thread = None
+    def _set_head(self, pan, roll, pitch):
+        """
+        Write the neck goals that moved since the last call. The SDK batches
+        goal writes into its sync loop, so skipping unchanged joints is what
+        actually trims the outgoing traffic.
+        """
+        last_pan, last_roll, last_pitch = self._last_goal
+        eps = self.GOAL_EPSILON
+        if last_pan is None or abs(pan - last_pan) > eps:
+            self._yaw.goal_position = pan
+            last_pan = pan
+        if last_roll is None or abs(roll - last_roll) > eps:
+            self._roll.goal_position = roll
+            last_roll = roll
+        if last_pitch is None or abs(pitch - last_pitch) > eps:
+            self._pitch.goal_position = pitch
+            last_pitch = pitch
+        self._last_goal = (last_pan, last_roll, last_pitch)
+
+    def _set_antenna_mode(self, mode):
+        """Switch the antenna animation, waking the antenna thread only on a change"""
+        if not self.enable_antenna or mode == self.current_antenna_mode:
+            return
+        with self._antenna_condition:
+            self.current_antenna_mode = mode
+            self._antenna_condition.notify_all()
+
+    def _set_antennas(self, left, right):
+        """Write both antenna goals, skipping the write if they are already there"""
+        if self._last_antennas == (left, right):
+            return
+        self._la.goal_position = left
+        self._ra.goal_position = right
+        self._last_antennas = (left, right)
+
+    def _hold(self, mode, timeout=None):
+        """
+        Wait for timeout seconds (forever if None) or until the mode changes
+
+        Returns:
+            bool: True if the animation for mode should continue
+        """
+        with self._antenna_condition:
+            self._antenna_condition.wait_for(
+                lambda: not self.antenna_thread_running or self.current_antenna_mode != mode,
+                timeout
+            )
+            return self.antenna_thread_running and self.current_antenna_mode == mode
+
+    @staticmethod
+    def _antenna_steps(mode):
+        """
+        Antenna animation for a mode as (left, right, hold) steps, hold None
+        keeps the pose until the mode changes. The animation restarts when
+        the steps run out.
+        """
+        if mode == "sad":
+            yield -125, 125, 0.3
+            yield -120, 120, 0.0
+
+        elif mode == "tracking":
+            wiggle = random.uniform(-15, 15)
+            yield -15 + wiggle, 15 - wiggle, random.uniform(0.3, 0.8)
+
+        elif mode == "scanning":
+            for _ in range(2):
+                yield -125, 125, 0.3
+                yield -100, 100, 0.3
+
+        elif mode == "giving_up":
+            for pos in range(0, -21, -2):
+                yield -pos, pos, 0.1
+
+        else:
+            yield 0, 0, None
 
     def _antenna_controller(self):
         """Background thread to control antenna movements"""
         while self.antenna_thread_running:
             try:
-                if self.current_antenna_mode == "sad":
-                    self.reachy.head.l_antenna.goal_position = -125
-                    self.reachy.head.r_antenna.goal_position = 125
-                    time.sleep(0.3)
-                    self.reachy.head.l_antenna.goal_position = -120
-                    self.reachy.head.r_antenna.goal_position = 120
-
-                elif self.current_antenna_mode == "tracking":
-                    base_left = -15
-                    base_right = 15
-                    wiggle = random.uniform(-15, 15)
-
-                    self.reachy.head.l_antenna.goal_position = base_left + wiggle
-                    self.reachy.head.r_antenna.goal_position = base_right - wiggle
-                    time.sleep(random.uniform(0.3, 0.8))
-
-                elif self.current_antenna_mode == "idle":
-                    self.reachy.head.l_antenna.goal_position = 0
-                    self.reachy.head.r_antenna.goal_position = 0
-                    time.sleep(0.5)
-
-                elif self.current_antenna_mode == "scanning":
-                    for _ in range(2):
-                        if not self.antenna_thread_running or self.current_antenna_mode != "scanning":
-                            break
-                        self.reachy.head.l_antenna.goal_position = -125
-                        self.reachy.head.r_antenna.goal_position = 125
-                        time.sleep(0.3)
-                        self.reachy.head.l_antenna.goal_position = -100
-                        self.reachy.head.r_antenna.goal_position = 100
-                        time.sleep(0.3)
-
-                elif self.current_antenna_mode == "giving_up":
-                    for pos in range(0, -21, -2):
-                        if not self.antenna_thread_running or self.current_antenna_mode != "giving_up":
-                            break
-                        self.reachy.head.l_antenna.goal_position = -pos
-                        self.reachy.head.r_antenna.goal_position = pos
-                        time.sleep(0.1)
+                mode = self.current_antenna_mode
+                for left, right, hold in self._antenna_steps(mode):
+                    self._set_antennas(left, right)
+                    if not self._hold(mode, hold):
+                        break
 
             except Exception as e:
                 print(f"Antenna error: {e}")
+                self._last_antennas = None
                 time.sleep(0.5)
 
+    def _control_loop(self):
+        """Interpolate toward the latest targets and send goals at CONTROL_HZ"""
+        period = 1.0 / self.CONTROL_HZ
+        rate = 1.0 - (1.0 - self.INTERPOLATION_RATE) ** (self.INTERPOLATION_FPS / self.CONTROL_HZ)
+        current, target = self._current, self._target
+        delta = np.empty(3)
+        next_tick = time.monotonic()
+
+        while self.tracking_thread_running:
+            try:
+                with self._head_lock:
+                    np.subtract(target, current, out=delta)
+                    delta *= rate
+                    current += delta
+                    pan, roll, pitch = current.tolist()
+                    self._set_head(pan, roll, pitch)
+            except Exception as e:
+                print(f"Control error: {e}")
+
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind, don't try to catch up with a burst of writes
+                next_tick = time.monotonic()
+
+    def _publish_loop(self):
+        """Draw the overlay and publish the latest detected frame"""
+        while self.tracking_thread_running:
+            with self._publish_condition:
+                self._publish_condition.wait_for(
+                    lambda: self._publish_item is not None or not self.tracking_thread_running
+                )
+                item = self._publish_item
+                self._publish_item = None
+            if item is None:
+                continue
+
+            try:
+                image, face_x, face_y, face_detected, current_time = item
+
+                # Frames faster than PUBLISH_HZ are replaced before anyone reads them, and
+                # with nobody watching publish only often enough to stay discoverable
+                since_publish = current_time - self._last_publish_time
+                if since_publish < 1.0 / self.PUBLISH_HZ:
+                    continue
+                if since_publish < self.IDLE_PUBLISH_INTERVAL and not CameraFrameProvider.has_subscribers():
+                    continue
+                self._last_publish_time = current_time
+
+                # Prepare frame for publishing, the publisher copies it so the raw image can go as is
+                display_frame = image
+                if self.show_overlay:
+                    if self._overlay_buf is None or self._overlay_buf.shape != image.shape:
+                        self._overlay_buf = np.empty_like(image)
+                    np.copyto(self._overlay_buf, image)
+                    display_frame = self.tracker.draw_debug_overlay(self._overlay_buf, face_x, face_y)
+
+                # Publish frame with metadata
+                pan, roll, pitch = self._current.tolist()
+                metadata = {
+                    'timestamp': current_time,
+                    'face_detected': face_detected,
+                    'face_position': {'x': float(face_x), 'y': float(face_y)} if face_x else None,
+                    'head_position': {
+                        'pan': pan,
+                        'roll': roll,
+                        'pitch': pitch
+                    },
+                    'tracking_state': self.scanning_state,
+                    'antenna_mode': self.current_antenna_mode
+                }
+
+                CameraFrameProvider.publish_frame(display_frame, metadata)
+
+            except Exception as e:
+                print(f"Publish error: {e}")
+
     def _tracking_loop(self):
-        """Main tracking loop with ROI-based movement control"""
-        self.current_pan = self.reachy.head.neck_yaw.present_position
-        self.current_roll = self.reachy.head.neck_roll.present_position
-        self.current_pitch = self.reachy.head.neck_pitch.present_position
-        self.target_pan = self.current_pan
-        self.target_roll = self.current_roll
-        self.target_pitch = self.current_pitch
+        """Camera and detection loop, updates the targets the control thread steers toward"""
+        yaw, roll, pitch = self._yaw, self._roll, self._pitch
 
         while self.tracking_thread_running:
             try:
                 self.frame_count += 1
                 current_time = time.time()
 
-                image = self.reachy.left_camera.last_frame
+                image = self._read_frame()
                 if image is None:
                     continue
 
-                image.flags.writeable = False
-                image_rgb = cv.cvtColor(image, cv.COLOR_BGR2RGB)
-                results = self.face_detection.process(image_rgb)
+                # BlazeFace runs at a fixed small size, so shrink before the color swap to touch fewer bytes.
+                # The detections are relative, so they map straight back onto the full frame.
+                cv.resize(image, self.detection_size, dst=self._det_buf, interpolation=cv.INTER_AREA)
+                if self._detect_bgr:
+                    results = self.face_detection.process_bgr(self._det_buf)
+                else:
+                    image_rgb = self._rgb_buf
+                    image_rgb.flags.writeable = True
+                    cv.cvtColor(self._det_buf, cv.COLOR_BGR2RGB, dst=image_rgb)
+                    image_rgb.flags.writeable = False
+                    results = self.face_detection.process(image_rgb)
 
                 face_x, face_y = None, None
                 face_detected = False
@@ -333,8 +505,7 @@ class ReachyFaceTracker:
                     self.scan_count = 0
                     self.scanning_state = "idle"
 
-                    if self.enable_antenna:
-                        self.current_antenna_mode = "tracking"
+                    self._set_antenna_mode("tracking")
 
                     detection = results.detections[0]
                     bbox = detection.location_data.relative_bounding_box
@@ -349,12 +520,11 @@ class ReachyFaceTracker:
                     if movement is not None:
                         pan_adjustment, roll_adjustment = movement
 
-                        actual_pan = self.reachy.head.neck_yaw.present_position
-                        actual_roll = self.reachy.head.neck_roll.present_position
+                        actual_pan = yaw.present_position
+                        actual_roll = roll.present_position
 
-                        self.target_pan = actual_pan + pan_adjustment
-                        self.target_roll = actual_roll + roll_adjustment
-                        self.target_pitch = 0
+                        with self._head_lock:
+                            self._target[:] = (actual_pan + pan_adjustment, actual_roll + roll_adjustment, 0)
 
                 else:
                     # NO FACE - scanning behavior
@@ -365,15 +535,12 @@ class ReachyFaceTracker:
                             self.scanning_state = "scanning"
                             self.scan_count = 0
                             self.state_start_time = current_time
-                            if self.enable_antenna:
-                                self.current_antenna_mode = "scanning"
+                            self._set_antenna_mode("scanning")
                         else:
-                            if self.enable_antenna:
-                                self.current_antenna_mode = "idle"
+                            self._set_antenna_mode("idle")
 
                     elif self.scanning_state == "scanning":
-                        if self.enable_antenna:
-                            self.current_antenna_mode = "scanning"
+                        self._set_antenna_mode("scanning")
 
                         if self.frame_count % 90 == 0:
                             self.scan_count += 1
@@ -381,8 +548,7 @@ class ReachyFaceTracker:
                             if self.scan_count > self.MAX_SCANS:
                                 self.scanning_state = "giving_up"
                                 self.state_start_time = current_time
-                                if self.enable_antenna:
-                                    self.current_antenna_mode = "giving_up"
+                                self._set_antenna_mode("giving_up")
                             else:
                                 random_pan_magnitude = random.uniform(30, 75)
                                 random_roll = random.uniform(-5, 5)
@@ -394,83 +560,58 @@ class ReachyFaceTracker:
 
                                 self.PANLEFT = not self.PANLEFT
 
-                                self.target_pan = random_pan
-                                self.target_roll = random_roll
-                                self.target_pitch = 0
+                                with self._head_lock:
+                                    self._target[:] = (random_pan, random_roll, 0)
 
                     elif self.scanning_state == "giving_up":
                         if current_time - self.state_start_time > 1.5:
                             self.scanning_state = "sad"
                             self.state_start_time = current_time
-                            if self.enable_antenna:
-                                self.current_antenna_mode = "sad"
+                            self._set_antenna_mode("sad")
 
                     elif self.scanning_state == "sad":
-                        if self.enable_antenna:
-                            self.current_antenna_mode = "sad"
+                        self._set_antenna_mode("sad")
 
                         if current_time - self.state_start_time > 2.0:
                             self.scanning_state = "looking_down"
                             self.state_start_time = current_time
-                            goto(
-                                goal_positions={
-                                    self.reachy.head.neck_yaw: 0,
-                                    self.reachy.head.neck_roll: -30,
-                                    self.reachy.head.neck_pitch: 0
-                                },
-                                duration=0.4,
-                                interpolation_mode=InterpolationMode.MINIMUM_JERK
-                            )
+                            # Keep the control thread off the neck while goto drives it
+                            with self._head_lock:
+                                goto(
+                                    goal_positions={
+                                        yaw: 0,
+                                        roll: -30,
+                                        pitch: 0
+                                    },
+                                    duration=0.4,
+                                    interpolation_mode=InterpolationMode.MINIMUM_JERK
+                                )
+                                self._target[:] = (0, -30, 0)
+                                self._current[:] = self._target
+                                self._last_goal = (0, -30, 0)
 
                     elif self.scanning_state == "looking_down":
-                        if self.enable_antenna:
-                            self.current_antenna_mode = "sad"
+                        self._set_antenna_mode("sad")
 
                         if current_time - self.state_start_time > 3.0:
                             self.scanning_state = "waiting"
                             self.state_start_time = current_time
 
                     elif self.scanning_state == "waiting":
-                        if self.enable_antenna:
-                            self.current_antenna_mode = "sad"
+                        self._set_antenna_mode("sad")
 
                         if current_time - self.state_start_time > 2.0:
                             self.scanning_state = "scanning"
                             self.scan_count = 0
                             self.state_start_time = current_time
-                            if self.enable_antenna:
-                                self.current_antenna_mode = "scanning"
-                            self.target_pitch = 0
-
-                # Smooth interpolation
-                self.current_pan += (self.target_pan - self.current_pan) * self.INTERPOLATION_RATE
-                self.current_roll += (self.target_roll - self.current_roll) * self.INTERPOLATION_RATE
+                            self._set_antenna_mode("scanning")
+                            with self._head_lock:
+                                self._target[2] = 0
 
-                # Send positions
-                self.reachy.head.neck_yaw.goal_position = self.current_pan
-                self.reachy.head.neck_roll.goal_position = self.current_roll
-                self.reachy.head.neck_pitch.goal_position = self.current_pitch
-
-                # Prepare frame for publishing
-                display_frame = image.copy()
-                if self.show_overlay:
-                    display_frame = self.tracker.draw_debug_overlay(display_frame, face_x, face_y)
-
-                # Publish frame with metadata
-                metadata = {
-                    'timestamp': current_time,
-                    'face_detected': face_detected,
-                    'face_position': {'x': float(face_x), 'y': float(face_y)} if face_x else None,
-                    'head_position': {
-                        'pan': float(self.current_pan),
-                        'roll': float(self.current_roll),
-                        'pitch': float(self.current_pitch)
-                    },
-                    'tracking_state': self.scanning_state,
-                    'antenna_mode': self.current_antenna_mode
-                }
-
-                CameraFrameProvider.publish_frame(display_frame, metadata)
+                # Hand the frame to the publish thread, replacing any frame it has not picked up yet
+                with self._publish_condition:
+                    self._publish_item = (image, face_x, face_y, face_detected, current_time)
+                    self._publish_condition.notify()
 
             except Exception as e:
                 print(f"Tracking error: {e}")
@@ -484,26 +625,45 @@ class ReachyFaceTracker:
             self.reachy.turn_on('head')
             time.sleep(1)
 
-            # Start tracking thread
+            with self._head_lock:
+                self._current[:] = (self._yaw.present_position,
+                                    self._roll.present_position,
+                                    self._pitch.present_position)
+                self._target[:] = self._current
+            self._last_goal = (None, None, None)
+
+            # Start detection, control and publish threads
             self.tracking_thread_running = True
             self.tracking_thread = threading.Thread(target=self._tracking_loop, daemon=True)
+            self.control_thread = threading.Thread(target=self._control_loop, daemon=True)
+            self.publish_thread = threading.Thread(target=self._publish_loop, daemon=True)
             self.tracking_thread.start()
+            self.control_thread.start()
+            self.publish_thread.start()
             print("Face tracking started")
             print("Publishing frames to CameraFrameProvider")
 
     def stop_tracking(self):
         """Stop the face tracking system"""
         print("\nStopping tracking...")
-        self.tracking_thread_running = False
+        with self._publish_condition:
+            self.tracking_thread_running = False
+            self._publish_condition.notify_all()
 
-        if self.tracking_thread is not None:
-            self.tracking_thread.join(timeout=2)
+        for thread in (self.tracking_thread, self.control_thread, self.publish_thread):
+            if thread is not None:
+                thread.join(timeout=2)
 
         if self.enable_antenna:
-            self.antenna_thread_running = False
+            with self._antenna_condition:
+                self.antenna_thread_running = False
+                self._antenna_condition.notify_all()
             self.antenna_thread.join(timeout=2)
 
         self.face_detection.close()
+        if self.capture is not None:
+            self.capture.release()
+        CameraFrameProvider.cleanup()
 
         # Return to neutral
         goto(
@@ -525,6 +685,14 @@ class ReachyFaceTracker:
 
 def main():
     """Run as standalone application"""
+    parser = argparse.ArgumentParser(description="Reachy Face Tracking Service")
+    parser.add_argument('--accel', choices=sorted(ACCEL_PROVIDERS), default='cpu',
+                        help="Accelerator for the ONNX face detector (default: cpu)")
+    parser.add_argument('--camera-url', default=None,
+                        help="Read the head camera directly (device index, /dev/videoN or RTSP URL) "
+                             "instead of through the SDK")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Reachy Face Tracking Service")
     print("=" * 60)
@@ -535,7 +703,9 @@ def main():
     tracker = ReachyFaceTracker(
         reachy_host='localhost',
         show_overlay=True,
-        enable_antenna=True
+        enable_antenna=True,
+        accel=args.accel,
+        camera_url=args.camera_url
     )
 
     # Start tracking
@@ -1,80 +1,116 @@
 from flask import Flask, render_template, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
+from importlib import import_module
 import os
 import sys
 
-from Flask.handlers.macro_recorder import macro_recorder_bp
-from Flask.reachy import REACHY_SDK_AVAILABLE
-from Flask.camera import CAMERA_AVAILABLE
-
-# Handlers
-from Flask.handlers.macro_recorder import macro_recorder_bp
-from Flask.handlers.index import index_bp
-from Flask.handlers.camera import camera_bp
-from Flask.handlers.api.camera_feed import camera_feed_bp
-from Flask.handlers.api.camera_status import camera_status_bp
-from Flask.handlers.api.logs import api_logs_bp
-from Flask.handlers.logs import logs_bp
-from Flask.handlers.save_config import save_config_bp
-from Flask.handlers.api.logs_clear import logs_clear_bp
-from Flask.handlers.service.action import action_bp
-from Flask.handlers.service.status import status_bp
-from Flask.handlers.movement_recorder import movement_recorder_bp
-from Flask.handlers.api.movement.capture import capture_bp
-from Flask.handlers.api.movement.joints import joints_bp
-from Flask.handlers.api.movement.positions import positions_bp
-from Flask.handlers.api.movement.start_compliant import start_compliant_bp
-from Flask.handlers.api.movement.stop_compliant import stop_compliant_bp
-from Flask.handlers.api.movement.emergency_stop import emergency_stop_bp
-from Flask.handlers.api.movement.toggle_joint import toggle_joint_bp
-from Flask.handlers.persona_config import persona_config_bp
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-if not REACHY_SDK_AVAILABLE:
-    print("Warning: reachy_sdk not available. Movement recorder will not function.")
 
-if not CAMERA_AVAILABLE:
-    print("Camera frame provider not available")
-    
-
-app = Flask(__name__)
-
-
-# ==================== CAMERA ROUTES ====================
-
-app.register_blueprint(camera_feed_bp)
-app.register_blueprint(camera_status_bp)
-app.register_blueprint(camera_bp)
-
-# ==================== ORIGINAL ROUTES ====================
-
-app.register_blueprint(index_bp)
-app.register_blueprint(logs_bp)
-app.register_blueprint(api_logs_bp)
-app.register_blueprint(logs_clear_bp)
-app.register_blueprint(save_config_bp)
-app.register_blueprint(action_bp)
-app.register_blueprint(status_bp)
-app.register_blueprint(persona_config_bp)
-
-# ==================== MOVEMENT RECORDER ROUTES ====================
-
-app.register_blueprint(movement_recorder_bp)
-app.register_blueprint(macro_recorder_bp)
-app.register_blueprint(joints_bp)
-app.register_blueprint(start_compliant_bp)
-app.register_blueprint(stop_compliant_bp)
-app.register_blueprint(emergency_stop_bp)
-app.register_blueprint(toggle_joint_bp)
-app.register_blueprint(positions_bp)
-app.register_blueprint(capture_bp)
-
-@app.context_processor
-def inject_active_page():
-    return dict(active_page=request.path)
-
-def run():
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    jsonify() and request.json through orjson. Key order and indentation follow
+    the default provider, but non-ASCII text is written as UTF-8 instead of
+    being escaped.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        # response() asks for indent=2 when the app runs in debug mode, orjson only indents by 2
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **_kwargs):
+        return orjson.loads(s)
+
+
+# Blueprints per profile as (module, attribute), imported only when the
+# profile is served so a camera-only worker never loads the movement stack
+BLUEPRINT_GROUPS = {
+    # ==================== CAMERA ROUTES ====================
+    'stream': (
+        ('Flask.handlers.api.camera_feed', 'camera_feed_bp'),
+        ('Flask.handlers.api.camera_status', 'camera_status_bp'),
+        ('Flask.handlers.camera', 'camera_bp'),
+    ),
+    # ==================== ORIGINAL ROUTES ====================
+    'ui': (
+        ('Flask.handlers.index', 'index_bp'),
+        ('Flask.handlers.logs', 'logs_bp'),
+        ('Flask.handlers.api.logs', 'api_logs_bp'),
+        ('Flask.handlers.api.logs_clear', 'logs_clear_bp'),
+        ('Flask.handlers.save_config', 'save_config_bp'),
+        ('Flask.handlers.service.action', 'action_bp'),
+        ('Flask.handlers.service.status', 'status_bp'),
+        ('Flask.handlers.persona_config', 'persona_config_bp'),
+    ),
+    # ==================== MOVEMENT RECORDER ROUTES ====================
+    'control': (
+        ('Flask.handlers.movement_recorder', 'movement_recorder_bp'),
+        ('Flask.handlers.macro_recorder', 'macro_recorder_bp'),
+        ('Flask.handlers.api.movement.joints', 'joints_bp'),
+        ('Flask.handlers.api.movement.start_compliant', 'start_compliant_bp'),
+        ('Flask.handlers.api.movement.stop_compliant', 'stop_compliant_bp'),
+        ('Flask.handlers.api.movement.emergency_stop', 'emergency_stop_bp'),
+        ('Flask.handlers.api.movement.toggle_joint', 'toggle_joint_bp'),
+        ('Flask.handlers.api.movement.positions', 'positions_bp'),
+        ('Flask.handlers.api.movement.capture', 'capture_bp'),
+    ),
+}
+
+PROFILES = {
+    'stream': ('stream',),
+    'ui': ('ui',),
+    'control': ('control',),
+    'full': ('stream', 'ui', 'control'),
+}
+
+
+def create_app(profile='full'):
+    """
+    Build the webapp with the blueprints of one profile
+
+    Args:
+        profile: One of PROFILES, 'full' serves everything
+    """
+    groups = PROFILES[profile]
+
+    if 'control' in groups:
+        from Flask.reachy import REACHY_SDK_AVAILABLE
+        if not REACHY_SDK_AVAILABLE:
+            print("Warning: reachy_sdk not available. Movement recorder will not function.")
+
+    if 'stream' in groups:
+        from Flask.camera import CAMERA_AVAILABLE
+        if not CAMERA_AVAILABLE:
+            print("Camera frame provider not available")
+
+    app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+    for group in groups:
+        for module_name, attribute in BLUEPRINT_GROUPS[group]:
+            app.register_blueprint(getattr(import_module(module_name), attribute))
+
+    @app.context_processor
+    def inject_active_page():
+        return dict(active_page=request.path)
+
+    return app
+
+def run(profile='full'):
+    # One thread per request, so the blocking robot sequences (emergency stop,
+    # compliant mode) never hold up the polling endpoints
+    create_app(profile).run(debug=True, host='0.0.0.0', port=5000, use_reloader=False, threaded=True)
 
 if __name__ == '__main__':
     run()
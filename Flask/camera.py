@@ -1,53 +1,99 @@
+import threading
 import time
 import cv2 as cv
-from Flask.global_variables import log_lines
+from Flask.global_variables import log
 
 
-# Camera frame provider import
+# Camera frame provider import, straight from the publisher module so the
+# webapp does not pull in the tracker and its robot/detector dependencies
 try:
-    from FaceTracking.reachy_face_tracking import CameraFrameProvider
+    from FaceTracking.Controllers.frame_publisher import CameraFrameProvider
     CAMERA_AVAILABLE = True
 except ImportError:
     CameraFrameProvider = None
     CAMERA_AVAILABLE = False
 
 
+# Stream rate cap, clients never poll faster than this
+STREAM_FPS = 30
+
+# Last encoded MJPEG part, shared by every connected client
+_encoded_lock = threading.Lock()
+_encoded_cache = {'ts': None, 'chunk': None}
+
+# Fixed parts of every MJPEG part around the JPEG length and data
+_PART_HEAD = b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: '
+_PART_SEP = b'\r\n\r\n'
+_PART_TAIL = b'\r\n'
+
+
+def _encode_frame_chunk(frame):
+    """Encode a frame into a complete MJPEG part (boundary, headers and JPEG)"""
+    ret, jpeg = cv.imencode('.jpg', frame, [cv.IMWRITE_JPEG_QUALITY, 85])
+    if not ret:
+        return None
+
+    # Join straight from the encoder's buffer, one allocation for the whole part
+    return b''.join((_PART_HEAD, str(jpeg.nbytes).encode('ascii'), _PART_SEP, jpeg, _PART_TAIL))
+
+
+def _get_frame_chunk(frame, timestamp):
+    """Encode the frame once per timestamp, other clients reuse the cached part"""
+    with _encoded_lock:
+        if timestamp is not None and _encoded_cache['ts'] == timestamp:
+            return _encoded_cache['chunk']
+
+        chunk = _encode_frame_chunk(frame)
+        if chunk is not None:
+            _encoded_cache['ts'] = timestamp
+            _encoded_cache['chunk'] = chunk
+        return chunk
+
 
 def generate_camera_frames():
     """Generator for camera video stream with error recovery"""
     consecutive_errors = 0
     max_errors = 10
-    
+    last_timestamp = None
+    last_seq = 0
+
+    if not CAMERA_AVAILABLE:
+        return
+
     while True:
-        if not CAMERA_AVAILABLE:
-            continue
-        
         try:
-            frame, _ = CameraFrameProvider.get_latest_frame()
+            # Sleep until the publisher has something new instead of copying the same frame again
+            seq = CameraFrameProvider.wait_for_frame(last_seq, timeout=1.0)
+            if seq and seq == last_seq:
+                continue
+
+            frame, metadata = CameraFrameProvider.get_latest_frame()
             
             if frame is None:
                 consecutive_errors += 1
                 if consecutive_errors > max_errors:
-                    log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Too many failed frame reads[/red]")
+                    log("[red]Too many failed frame reads[/red]")
                     break
+                time.sleep(1.0 / STREAM_FPS)
                 continue
             
             # Reset error counter on success
             consecutive_errors = 0
-            
-            # Encode frame
-            ret, jpeg = cv.imencode('.jpg', frame, [cv.IMWRITE_JPEG_QUALITY, 85])
-            
-            if not ret:
+
+            # Same frame as last time, wait for the publisher instead of spinning
+            timestamp = metadata.get('timestamp') if metadata else None
+            if timestamp is not None and timestamp == last_timestamp:
+                last_seq = seq
+                time.sleep(1.0 / STREAM_FPS)
                 continue
-            
-            frame_data = jpeg.tobytes()
-            
-            # Yield with proper MJPEG boundary
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n'
-                   b'Content-Length: ' + str(len(frame_data)).encode() + b'\r\n'
-                   b'\r\n' + frame_data + b'\r\n')
+
+            chunk = _get_frame_chunk(frame, timestamp)
+            if chunk is None:
+                continue
+
+            last_timestamp = timestamp
+            last_seq = seq
+            yield chunk
             
         except GeneratorExit:
             # Client disconnected
@@ -55,5 +101,5 @@ def generate_camera_frames():
         except Exception as e:
             consecutive_errors += 1
             if consecutive_errors > max_errors:
-                log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Stream error: {str(e)}[/red]")
+                log(f"[red]Stream error: {str(e)}[/red]")
                 break
@@ -1,8 +1,125 @@
+import json
+import threading
+import time
 from collections import deque
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(data):
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+class LogBuffer:
+    """
+    Bounded log of (time.time(), message) entries. The /api/logs JSON is built
+    once per change and served from cache between polls, and streaming readers
+    block in wait_for_entries until something is logged.
+    """
+
+    def __init__(self, maxlen=500):
+        self._entries = deque(maxlen=maxlen)
+        self._condition = threading.Condition()
+        self._seq = 0
+        # Entries ever appended, and clears so far, for streaming readers' cursors
+        self._total = 0
+        self._generation = 0
+        self._snapshot_seq = 0
+        # Formatted timestamps by whole second, kept for the seconds still in the buffer
+        self._stamps = {}
+        self._snapshot = _dump_json({'logs': []})
+
+    def append(self, message):
+        with self._condition:
+            self._entries.append((time.time(), message))
+            self._total += 1
+            self._seq += 1
+            self._condition.notify_all()
+
+    def clear(self):
+        with self._condition:
+            self._entries.clear()
+            self._generation += 1
+            self._seq += 1
+            self._condition.notify_all()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def _format_entries(self, entries):
+        """
+        Prefix entries with their formatted timestamp, entries logged in the same
+        second share one strftime call
+
+        Returns:
+            (lines, stamps) with the stamps used, by whole second
+        """
+        old_stamps, stamps = self._stamps, {}
+        lines = []
+        for timestamp, message in entries:
+            second = int(timestamp)
+            stamp = stamps.get(second)
+            if stamp is None:
+                stamp = old_stamps.get(second)
+                if stamp is None:
+                    stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                stamps[second] = stamp
+            lines.append(f"[{stamp}] {message}")
+        return lines, stamps
+
+    def snapshot(self):
+        """Return the logs as a UTF-8 JSON document, rebuilt only after a change"""
+        seq = self._seq
+        if seq != self._snapshot_seq:
+            lines, self._stamps = self._format_entries(list(self._entries))
+            self._snapshot = _dump_json({'logs': lines})
+            self._snapshot_seq = seq
+        return self._snapshot
+
+    def wait_for_entries(self, cursor=0, generation=-1, timeout=None):
+        """
+        Block until entries were logged after cursor or the log was cleared
+
+        Args:
+            cursor, generation: Values returned by the previous call, the
+                defaults return the whole log straight away
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            (lines, cursor, generation, reset) where reset means lines replace
+            everything the reader has, otherwise lines follow on from the last call
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._total != cursor or self._generation != generation, timeout
+            )
+            reset = self._generation != generation
+            count = len(self._entries) if reset else min(self._total - cursor, len(self._entries))
+            entries = list(self._entries)[len(self._entries) - count:] if count else []
+            cursor, generation = self._total, self._generation
+
+        lines, _ = self._format_entries(entries)
+        return lines, cursor, generation, reset
+
+
 # Store the process ID of the running main.py
 running_process = None
-log_lines = deque(maxlen=500)  # Store last 500 log lines
+log_lines = LogBuffer(maxlen=500)  # Store last 500 log lines
+
+
+def log(message):
+    """Add a message to the log, the timestamp is only formatted when the logs are read"""
+    log_lines.append(message)
+
 
 # Global variables for Reachy connection
 reachy_connection = None
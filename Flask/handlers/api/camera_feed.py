@@ -1,15 +1,18 @@
 from flask import Blueprint, Response
-import cv2 as cv
-import time
 from Flask.camera import CAMERA_AVAILABLE, generate_camera_frames
-from Flask.global_variables import log_lines
+from Flask.global_variables import log
 
 
-camera_feed_bp = Blueprint('camera_feed', __name__)
+camera_feed_bp = Blueprint('camera_feed', __name__, url_prefix='/api/camera')
 
-@camera_feed_bp.route('/api/camera/feed')
+@camera_feed_bp.before_request
+def require_camera():
+    """Answer 503 up front instead of opening a stream that ends straight away"""
+    if not CAMERA_AVAILABLE:
+        return Response("Camera module not loaded", status=503)
+
+@camera_feed_bp.route('/feed')
 def camera_feed():
-    print(CAMERA_AVAILABLE)
     """Live MJPEG camera stream"""
     try:
         return Response(
@@ -23,6 +26,6 @@ def camera_feed():
             }
         )
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Camera feed error: {str(e)}[/red]")
+        log(f"[red]Camera feed error: {str(e)}[/red]")
         return Response("Camera feed error", status=500)
     
\ No newline at end of file
@@ -2,9 +2,9 @@ from flask import Blueprint, Response, jsonify
 from Flask.camera import CAMERA_AVAILABLE, CameraFrameProvider
 
 
-camera_status_bp = Blueprint('camera_status', __name__)
+camera_status_bp = Blueprint('camera_status', __name__, url_prefix='/api/camera')
 
-@camera_status_bp.route('/api/camera/status')
+@camera_status_bp.route('/status')
 def camera_status():
     """Check if camera feed is available"""
     if not CAMERA_AVAILABLE:
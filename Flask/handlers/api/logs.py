@@ -1,10 +1,35 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response
+import json
 from Flask.global_variables import log_lines
 
 
 api_logs_bp = Blueprint('api_logs', __name__)
 
+# Comment line sent when nothing was logged for this long, so closed streams get noticed
+STREAM_KEEPALIVE = 15.0
+
 @api_logs_bp.route('/api/logs')
 def get_logs():
     """Return the current logs"""
-    return jsonify({'logs': list(log_lines)})
+    return Response(log_lines.snapshot(), mimetype='application/json')
+
+@api_logs_bp.route('/api/logs/stream')
+def stream_logs():
+    """Push new log lines as Server-Sent Events, a 'reset' event carries the whole log"""
+    def generate():
+        cursor, generation = 0, -1
+        while True:
+            lines, cursor, generation, reset = log_lines.wait_for_entries(
+                cursor, generation, timeout=STREAM_KEEPALIVE
+            )
+            if reset:
+                yield f"event: reset\ndata: {json.dumps(lines)}\n\n"
+            elif lines:
+                yield f"data: {json.dumps(lines)}\n\n"
+            else:
+                yield ": keepalive\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
@@ -2,9 +2,18 @@ from flask import Blueprint, jsonify
 import time
 from Flask.reachy import get_reachy, get_joint_by_name, goto, InterpolationMode
 from Flask.constants import REACHY_JOINTS
-from Flask.global_variables import compliant_mode_active, initial_positions, log_lines
+from Flask.global_variables import compliant_mode_active, initial_positions, log
 
 
+# Joints driven back to their initial position, grippers and antennas stay where they are
+RETURN_JOINTS = (
+    'r_shoulder_pitch', 'r_shoulder_roll', 'r_arm_yaw', 'r_elbow_pitch',
+    'r_forearm_yaw', 'r_wrist_pitch', 'r_wrist_roll',
+    'l_shoulder_pitch', 'l_shoulder_roll', 'l_arm_yaw', 'l_elbow_pitch',
+    'l_forearm_yaw', 'l_wrist_pitch', 'l_wrist_roll',
+    'neck_yaw', 'neck_roll', 'neck_pitch'
+)
+
 emergency_stop_bp = Blueprint('emergency_stop', __name__)
 
 @emergency_stop_bp.route('/api/movement/emergency-stop', methods=['POST'])
@@ -13,14 +22,14 @@ def emergency_stop():
     global compliant_mode_active, initial_positions
     
     try:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red bold]EMERGENCY STOP INITIATED[/red bold]")
+        log("[red bold]EMERGENCY STOP INITIATED[/red bold]")
         
         reachy = get_reachy()
         if reachy is None:
             return jsonify({'success': False, 'message': 'Cannot connect to Reachy'})
         
         # Step 1: Immediately stiffen all joints
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Step 1: Stiffening all joints...[/yellow]")
+        log("[yellow]Step 1: Stiffening all joints...[/yellow]")
         stiffened_joints = []
         for joint_name in REACHY_JOINTS:
             joint = get_joint_by_name(reachy, joint_name)
@@ -29,56 +38,20 @@ def emergency_stop():
                     joint.compliant = False
                     stiffened_joints.append(joint_name)
                 except Exception as e:
-                    log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error stiffening {joint_name}: {e}[/red]")
+                    log(f"[red]Error stiffening {joint_name}: {e}[/red]")
         
         time.sleep(0.5)
         
         # Step 2: Return to INITIAL positions (where we started)
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Step 2: Returning to initial position...[/yellow]")
+        log("[yellow]Step 2: Returning to initial position...[/yellow]")
         
         if initial_positions:
             # Build goal_positions dict from initial positions
             goal_positions = {}
-            
-            # Right arm
-            if 'r_shoulder_pitch' in initial_positions:
-                goal_positions[reachy.r_arm.r_shoulder_pitch] = initial_positions['r_shoulder_pitch']
-            if 'r_shoulder_roll' in initial_positions:
-                goal_positions[reachy.r_arm.r_shoulder_roll] = initial_positions['r_shoulder_roll']
-            if 'r_arm_yaw' in initial_positions:
-                goal_positions[reachy.r_arm.r_arm_yaw] = initial_positions['r_arm_yaw']
-            if 'r_elbow_pitch' in initial_positions:
-                goal_positions[reachy.r_arm.r_elbow_pitch] = initial_positions['r_elbow_pitch']
-            if 'r_forearm_yaw' in initial_positions:
-                goal_positions[reachy.r_arm.r_forearm_yaw] = initial_positions['r_forearm_yaw']
-            if 'r_wrist_pitch' in initial_positions:
-                goal_positions[reachy.r_arm.r_wrist_pitch] = initial_positions['r_wrist_pitch']
-            if 'r_wrist_roll' in initial_positions:
-                goal_positions[reachy.r_arm.r_wrist_roll] = initial_positions['r_wrist_roll']
-            
-            # Left arm
-            if 'l_shoulder_pitch' in initial_positions:
-                goal_positions[reachy.l_arm.l_shoulder_pitch] = initial_positions['l_shoulder_pitch']
-            if 'l_shoulder_roll' in initial_positions:
-                goal_positions[reachy.l_arm.l_shoulder_roll] = initial_positions['l_shoulder_roll']
-            if 'l_arm_yaw' in initial_positions:
-                goal_positions[reachy.l_arm.l_arm_yaw] = initial_positions['l_arm_yaw']
-            if 'l_elbow_pitch' in initial_positions:
-                goal_positions[reachy.l_arm.l_elbow_pitch] = initial_positions['l_elbow_pitch']
-            if 'l_forearm_yaw' in initial_positions:
-                goal_positions[reachy.l_arm.l_forearm_yaw] = initial_positions['l_forearm_yaw']
-            if 'l_wrist_pitch' in initial_positions:
-                goal_positions[reachy.l_arm.l_wrist_pitch] = initial_positions['l_wrist_pitch']
-            if 'l_wrist_roll' in initial_positions:
-                goal_positions[reachy.l_arm.l_wrist_roll] = initial_positions['l_wrist_roll']
-            
-            # Neck joints
-            if 'neck_yaw' in initial_positions:
-                goal_positions[reachy.head.neck_yaw] = initial_positions['neck_yaw']
-            if 'neck_roll' in initial_positions:
-                goal_positions[reachy.head.neck_roll] = initial_positions['neck_roll']
-            if 'neck_pitch' in initial_positions:
-                goal_positions[reachy.head.neck_pitch] = initial_positions['neck_pitch']
+            for joint_name in RETURN_JOINTS:
+                joint = get_joint_by_name(reachy, joint_name)
+                if joint is not None and joint_name in initial_positions:
+                    goal_positions[joint] = initial_positions[joint_name]
             
             if goal_positions:
                 goto(
@@ -86,21 +59,21 @@ def emergency_stop():
                     duration=2.0,
                     interpolation_mode=InterpolationMode.MINIMUM_JERK
                 )
-                log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [cyan]Returned to initial positions[/cyan]")
+                log("[cyan]Returned to initial positions[/cyan]")
         else:
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]No initial positions stored, staying in place[/yellow]")
+            log("[yellow]No initial positions stored, staying in place[/yellow]")
         
         time.sleep(2.5)
         
         # Step 3: Smoothly power down
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Step 3: Powering down safely...[/yellow]")
+        log("[yellow]Step 3: Powering down safely...[/yellow]")
         reachy.turn_off_smoothly('r_arm')
         reachy.turn_off_smoothly('l_arm')
         reachy.turn_off_smoothly('head')
         
         compliant_mode_active = False
         initial_positions = {}  # Clear stored positions
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]EMERGENCY STOP COMPLETE - Robot safely powered down[/green]")
+        log("[green]EMERGENCY STOP COMPLETE - Robot safely powered down[/green]")
         
         return jsonify({
             'success': True, 
@@ -109,7 +82,7 @@ def emergency_stop():
         })
         
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Emergency stop error: {str(e)}[/red]")
+        log(f"[red]Emergency stop error: {str(e)}[/red]")
         try:
             if reachy:
                 reachy.turn_off_smoothly('r_arm')
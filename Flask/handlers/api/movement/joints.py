@@ -1,34 +1,28 @@
-from flask import Blueprint, jsonify
-from Flask.reachy import get_reachy, get_joint_by_name
+from flask import Blueprint, Response
+import json
+from Flask.reachy import get_reachy, JOINT_CACHE
 from Flask.constants import REACHY_JOINTS
 
 joints_bp = Blueprint('joints', __name__)
 
+# (connection, response body), rebuilt only when the connection changes
+_joints_response = (None, None)
+
 @joints_bp.route('/api/movement/joints', methods=['GET'])
 def get_joints():
-    """Return list of available joints with their current state"""
-    try:
-        reachy = get_reachy()
-        joint_info = []
-        
+    """Return list of available joints"""
+    global _joints_response
+
+    reachy = get_reachy()
+    connection, body = _joints_response
+    if body is None or connection is not reachy:
         if reachy:
-            # Get actual joints from the robot
-            try:
-                for joint_name in REACHY_JOINTS:
-                    joint = get_joint_by_name(reachy, joint_name)
-                    if joint:
-                        joint_info.append({
-                            'name': joint_name,
-                            'compliant': joint.compliant if hasattr(joint, 'compliant') else False
-                        })
-            except:
-                # If we can't get state, just return names
-                joint_info = [{'name': j, 'compliant': False} for j in REACHY_JOINTS]
+            # Joints present on the robot, resolved once when it connected
+            joint_names = [j for j in REACHY_JOINTS if j in JOINT_CACHE]
         else:
             # Robot not connected, return default list
-            joint_info = [{'name': j, 'compliant': False} for j in REACHY_JOINTS]
-        
-        return jsonify({'success': True, 'joints': [j['name'] for j in joint_info]})
-    except Exception as e:
-        return jsonify({'success': True, 'joints': REACHY_JOINTS})  # Fallback to static list
-    
\ No newline at end of file
+            joint_names = REACHY_JOINTS
+        body = json.dumps({'success': True, 'joints': joint_names}).encode()
+        _joints_response = (reachy, body)
+
+    return Response(body, mimetype='application/json')
@@ -1,9 +1,7 @@
 from flask import Blueprint, jsonify
-import time
-import math
-from Flask.reachy import get_reachy, get_joint_by_name
+from Flask.reachy import get_reachy, read_joint_positions
 from Flask.constants import REACHY_JOINTS
-from Flask.global_variables import log_lines
+from Flask.global_variables import log
 
 
 positions_bp = Blueprint('positions', __name__)
@@ -16,34 +14,16 @@ def get_positions():
         if reachy is None:
             return jsonify({'success': False, 'message': 'Cannot connect to Reachy'})
         
-        positions = {}
-        nan_count = 0
-        
-        for joint_name in REACHY_JOINTS:
-            joint = get_joint_by_name(reachy, joint_name)
-            if joint:
-                try:
-                    pos = joint.present_position
-                    
-                    # Proper NaN check
-                    if pos is None or math.isnan(pos):
-                        positions[joint_name] = 0.0
-                        nan_count += 1
-                    else:
-                        positions[joint_name] = round(float(pos), 2)
-                        
-                except (AttributeError, TypeError, ValueError) as e:
-                    positions[joint_name] = 0.0
-            else:
-                positions[joint_name] = 0.0
+        read, nan_count = read_joint_positions(reachy)
+        positions = {joint_name: read.get(joint_name, 0.0) for joint_name in REACHY_JOINTS}
         
         # Only log if we have NaN issues (and not too frequently)
         if nan_count > 0 and nan_count == len(REACHY_JOINTS):
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Warning: All joints returning NaN values[/red]")
+            log("[red]Warning: All joints returning NaN values[/red]")
         
         return jsonify({'success': True, 'positions': positions})
         
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error getting positions: {str(e)}[/red]")
+        log(f"[red]Error getting positions: {str(e)}[/red]")
         return jsonify({'success': False, 'message': str(e)})
     
\ No newline at end of file
@@ -1,7 +1,7 @@
 from flask import Blueprint, request, jsonify
 import time
 import math
-from Flask.global_variables import compliant_mode_active, initial_positions, log_lines
+from Flask.global_variables import compliant_mode_active, initial_positions, log
 from Flask.reachy import get_reachy, get_joint_by_name, REACHY_SDK_AVAILABLE
 from Flask.constants import REACHY_JOINTS
 
@@ -22,7 +22,7 @@ def start_compliant_mode():
             return jsonify({'success': False, 'message': 'Cannot connect to Reachy'})
         
         # Turn on the robot (all joints stiff)
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [cyan]Turning on robot...[/cyan]")
+        log("[cyan]Turning on robot...[/cyan]")
         reachy.turn_on('r_arm')
         reachy.turn_on('l_arm')
         reachy.turn_on('head')
@@ -30,7 +30,7 @@ def start_compliant_mode():
         time.sleep(1.5)  # Wait for joints to stabilize
         
         # CAPTURE INITIAL POSITIONS
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [cyan]Reading initial positions...[/cyan]")
+        log("[cyan]Reading initial positions...[/cyan]")
         initial_positions = {}
         nan_joints = []
         
@@ -41,24 +41,24 @@ def start_compliant_mode():
                     pos = joint.present_position
                     
                     if pos is None or math.isnan(pos):
-                        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]{joint_name}: NaN - will use 0.0[/yellow]")
+                        log(f"[yellow]{joint_name}: NaN - will use 0.0[/yellow]")
                         initial_positions[joint_name] = 0.0
                         nan_joints.append(joint_name)
                     else:
                         initial_positions[joint_name] = round(float(pos), 2)
-                        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {joint_name}: {initial_positions[joint_name]}°")
+                        log(f"{joint_name}: {initial_positions[joint_name]}°")
                         
                 except Exception as e:
-                    log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]{joint_name}: Error - {str(e)}[/red]")
+                    log(f"[red]{joint_name}: Error - {str(e)}[/red]")
                     initial_positions[joint_name] = 0.0
                     nan_joints.append(joint_name)
         
         if nan_joints:
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Joints with NaN: {', '.join(nan_joints)}[/yellow]")
+            log(f"[yellow]Joints with NaN: {', '.join(nan_joints)}[/yellow]")
         
         compliant_mode_active = True
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]Ready! All joints are stiff and locked.[/green]")
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Use 'Unlock' buttons to make joints compliant for positioning[/yellow]")
+        log("[green]Ready! All joints are stiff and locked.[/green]")
+        log("[yellow]Use 'Unlock' buttons to make joints compliant for positioning[/yellow]")
         
         return jsonify({
             'success': True, 
@@ -67,6 +67,6 @@ def start_compliant_mode():
         })
         
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error: {str(e)}[/red]")
+        log(f"[red]Error: {str(e)}[/red]")
         return jsonify({'success': False, 'message': str(e)})
     
\ No newline at end of file
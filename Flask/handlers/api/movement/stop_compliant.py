@@ -1,8 +1,7 @@
 from flask import Blueprint, jsonify
 from Flask.reachy import get_reachy, get_joint_by_name
 from Flask.constants import REACHY_JOINTS
-from Flask.global_variables import log_lines, compliant_mode_active
-import time
+from Flask.global_variables import log, compliant_mode_active
 
 
 stop_compliant_bp = Blueprint('stop_compliant', __name__)
@@ -17,7 +16,7 @@ def stop_compliant_mode():
         if reachy is None:
             return jsonify({'success': False, 'message': 'Cannot connect to Reachy'})
         
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]Stiffening all joints...[/yellow]")
+        log("[yellow]Stiffening all joints...[/yellow]")
         
         # Stiffen all joints by setting them non-compliant
         stiffened_joints = []
@@ -27,12 +26,11 @@ def stop_compliant_mode():
                 try:
                     joint.compliant = False
                     stiffened_joints.append(joint_name)
-                    log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Stiffened {joint_name}")
                 except Exception as e:
-                    log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error stiffening {joint_name}: {e}[/red]")
+                    log(f"[red]Error stiffening {joint_name}: {e}[/red]")
         
         compliant_mode_active = False
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]All joints locked in current position[/green]")
+        log(f"[green]All joints locked in current position ({len(stiffened_joints)} stiffened)[/green]")
         
         return jsonify({
             'success': True, 
@@ -41,6 +39,6 @@ def stop_compliant_mode():
         })
         
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error in stop_compliant: {str(e)}[/red]")
+        log(f"[red]Error in stop_compliant: {str(e)}[/red]")
         return jsonify({'success': False, 'message': str(e)})
     
\ No newline at end of file
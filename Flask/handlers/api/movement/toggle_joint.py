@@ -1,14 +1,14 @@
 from flask import Blueprint, request, jsonify
-import time
 from Flask.reachy import get_reachy, get_joint_by_name
-from Flask.global_variables import log_lines
+from Flask.global_variables import log
 
 
 toggle_joint_bp = Blueprint('toggle_joint', __name__)
 
-toggle_joint_bp.route('/api/movement/toggle-joint', methods=['POST'])
+@toggle_joint_bp.route('/api/movement/toggle-joint', methods=['POST'])
 def toggle_joint():
     """Toggle a specific joint between compliant and stiff"""
+    joint_name = None
     try:
         data = request.json
         joint_name = data.get('joint')
@@ -29,11 +29,11 @@ def toggle_joint():
         actual_state = joint.compliant
         state = "locked (stiff)" if not actual_state else "unlocked (compliant)"
         
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {joint_name} set to {state}")
+        log(f"{joint_name} set to {state}")
         
         return jsonify({'success': True, 'message': f'{joint_name} {state}'})
         
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Error toggling {joint_name}: {str(e)}[/red]")
+        log(f"[red]Error toggling {joint_name}: {str(e)}[/red]")
         return jsonify({'success': False, 'message': str(e)})
     
\ No newline at end of file
@@ -1,23 +1,45 @@
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, render_template, request, jsonify
+from functools import lru_cache
+import hashlib
+from jinja2.utils import htmlsafe_json_dumps
 from Flask.constants import (
     AGE_RANGES, MOODS, LLM_PROVIDERS, LLM_MODELS,
     ELEVENLABS_VOICES, ASSISTANT_TYPES
 )
 
+# The page's script data never changes, serialize it once instead of running
+# |tojson over the same dicts on every render
+VOICE_MAPPINGS_JSON = htmlsafe_json_dumps(ELEVENLABS_VOICES, sort_keys=True)
+AGE_RANGES_JSON = htmlsafe_json_dumps(AGE_RANGES, sort_keys=True)
+LLM_MODELS_JSON = htmlsafe_json_dumps(LLM_MODELS, sort_keys=True)
+
 index_bp = Blueprint('index', __name__)
 
-@index_bp.route('/')
-def index():
-    return render_template(
+@lru_cache(maxsize=1)
+def _rendered_index():
+    """Render the page once, none of its inputs change while the app runs"""
+    html = render_template(
         'index.html', 
         personas=list(ELEVENLABS_VOICES.keys()),
-        voice_mappings=ELEVENLABS_VOICES,
-        age_ranges=AGE_RANGES,
+        voice_mappings_json=VOICE_MAPPINGS_JSON,
+        age_ranges_json=AGE_RANGES_JSON,
         moods=MOODS,
         llm_providers=LLM_PROVIDERS,
-        llm_models=LLM_MODELS,
+        llm_models_json=LLM_MODELS_JSON,
         assistant_types=ASSISTANT_TYPES
     )
+    return html, hashlib.md5(html.encode()).hexdigest()
+
+
+@index_bp.route('/')
+def index():
+    html, etag = _rendered_index()
+    response = Response(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    # Answers 304 Not Modified when the browser already has this version
+    return response.make_conditional(request)
 
 
 @index_bp.route('/build_prompt', methods=['POST'])
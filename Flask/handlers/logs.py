@@ -1,8 +1,23 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, Response, render_template, request
+from functools import lru_cache
+import hashlib
 
 
 logs_bp = Blueprint('logs', __name__)
 
+@lru_cache(maxsize=1)
+def _rendered_logs():
+    """Render the page once, the log lines are fetched by logs.js"""
+    html = render_template('logs.html')
+    return html, hashlib.md5(html.encode()).hexdigest()
+
+
 @logs_bp.route('/logs')
 def logs():
-    return render_template('logs.html')
+    html, etag = _rendered_logs()
+    response = Response(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    # Answers 304 Not Modified when the browser already has this version
+    return response.make_conditional(request)
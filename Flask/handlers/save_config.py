@@ -3,7 +3,6 @@ from pathlib import Path
 from Flask.constants import ELEVENLABS_VOICES, AGE_RANGES, MOODS, ASSISTANT_TYPES, PERSONAS
 import os
 from dotenv import load_dotenv
-from pathlib import Path
 
 CURRENT_AGE = None
 CURRENT_MOOD = None
@@ -55,33 +54,35 @@ def write_to_env(persona=None, age_range=None, mood=None, llm_provider=None, llm
 
     # Read existing env variables if the file exists
     if env_path.exists():
-        with open(env_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key] = value
+        for line in env_path.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                env_vars[key] = value
 
     # Update only the values provided
-    if persona is not None:
-        env_vars['PERSONA'] = persona
-    if age_range is not None:
-        env_vars['AGE_RANGE'] = age_range
-    if mood is not None:
-        env_vars['MOOD'] = mood
-    if llm_provider is not None:
-        env_vars['LLM_PROVIDER'] = llm_provider
-    if llm_model is not None:
-        env_vars['LLM_MODEL'] = llm_model
-    if voice_id is not None:
-        env_vars['VOICE_ID'] = voice_id
-    if assistant_type is not None:
-        env_vars['ASSISTANT_TYPE'] = assistant_type
-
-    # Write back all variables to the file
-    with open(env_path, 'w', encoding='utf-8') as f:
-        for key, value in env_vars.items():
-            f.write(f"{key}={value}\n")
+    updates = {
+        'PERSONA': persona,
+        'AGE_RANGE': age_range,
+        'MOOD': mood,
+        'LLM_PROVIDER': llm_provider,
+        'LLM_MODEL': llm_model,
+        'VOICE_ID': voice_id,
+        'ASSISTANT_TYPE': assistant_type,
+    }
+    env_vars.update((key, value) for key, value in updates.items() if value is not None)
+
+    # Write all variables to a temporary file and swap it in, so readers never
+    # see a half-written .env
+    data = ''.join(f"{key}={value}\n" for key, value in env_vars.items()).encode('utf-8')
+    tmp_path = env_path.with_name(env_path.name + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, env_path)
 
     return True
 
@@ -3,22 +3,61 @@ import subprocess
 import sys
 import threading
 import os
-import time
-from Flask.global_variables import log_lines, running_process
+import signal
+from Flask.global_variables import log, running_process
+
+# Environment for the service, built once instead of copying os.environ on every start
+_CHILD_ENV = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
 
 
 def read_process_output(process):
-    """Read output from process and store in log_lines"""
-    global log_lines
+    """Read output from process in large chunks and store each complete line in the log buffer"""
+    fd = process.stdout.fileno()
+    pending = bytearray()
     try:
         while True:
-            line = process.stdout.readline()
-            if not line:
+            chunk = os.read(fd, 65536)
+            if not chunk:
                 break
-            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-            log_lines.append(f"[{timestamp}] {line.strip()}")
+
+            pending += chunk
+            end = pending.rfind(b'\n')
+            if end < 0:
+                continue
+
+            # A newline byte never occurs inside a multi-byte UTF-8 character, so
+            # all complete lines of the chunk can be decoded in one call
+            text = pending[:end].decode('utf-8', errors='replace')
+            del pending[:end + 1]
+            for line in text.split('\n'):
+                log(line.strip())
+
+        if pending:
+            log(pending.decode('utf-8', errors='replace').strip())
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Error reading output: {str(e)}")
+        log(f"Error reading output: {str(e)}")
+
+
+def _signal_service(process, sig):
+    """Send sig to the service's process group, or to the service alone where there are no groups"""
+    if hasattr(os, 'killpg'):
+        # The service leads its own session, so its group id is its pid
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+    else:
+        process.send_signal(sig)
+
+
+def stop_process(process):
+    """Terminate the service and anything it started, kill them if still running after 5 seconds"""
+    _signal_service(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        _signal_service(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        process.wait()
 
 
 action_bp = Blueprint('action', __name__)
@@ -32,9 +71,6 @@ def service_control(action):
             if running_process and running_process.poll() is None:
                 return jsonify({'success': False, 'message': 'Service is already running'})
             
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-
             from dotenv import load_dotenv
             load_dotenv()
             VOICE_ID = os.getenv("VOICE_ID", "Unknown")
@@ -43,63 +79,46 @@ def service_control(action):
                 [sys.executable, '-u', 'main.py'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                encoding='utf-8',
-                errors='replace',
-                env=env
+                bufsize=0,
+                env=_CHILD_ENV,
+                start_new_session=True
             )
             
             thread = threading.Thread(target=read_process_output, args=(running_process,))
             thread.daemon = True
             thread.start()
             
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]✓ Service started[/green]")
+            log("[green]✓ Service started[/green]")
             return jsonify({'success': True, 'message': 'Reachy service started'})
         
         elif action == 'stop':
             if not running_process or running_process.poll() is not None:
                 return jsonify({'success': False, 'message': 'Service is not running'})
             
-            running_process.terminate()
-            try:
-                running_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                running_process.kill()
-                running_process.wait()
+            stop_process(running_process)
             
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]■ Service stopped[/red]")
+            log("[red]■ Service stopped[/red]")
             return jsonify({'success': True, 'message': 'Reachy service stopped'})
         
         elif action == 'restart':
             if running_process and running_process.poll() is None:
-                running_process.terminate()
-                try:
-                    running_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    running_process.kill()
-                    running_process.wait()
-                log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [yellow]↻ Service stopped for restart[/yellow]")
-            
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
+                stop_process(running_process)
+                log("[yellow]↻ Service stopped for restart[/yellow]")
             
             running_process = subprocess.Popen(
                 [sys.executable, '-u', 'main.py'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                encoding='utf-8',
-                errors='replace',
-                env=env
+                bufsize=0,
+                env=_CHILD_ENV,
+                start_new_session=True
             )
             
             thread = threading.Thread(target=read_process_output, args=(running_process,))
             thread.daemon = True
             thread.start()
             
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]✓ Service restarted[/green]")
+            log("[green]✓ Service restarted[/green]")
             return jsonify({'success': True, 'message': 'Reachy service restarted'})
         
         else:
@@ -1,5 +1,7 @@
-import time
-from Flask.global_variables import log_lines, reachy_connection
+import math
+from operator import attrgetter
+from Flask.constants import REACHY_JOINTS
+from Flask.global_variables import log, reachy_connection
 
 
 # Reachy SDK imports
@@ -25,35 +27,85 @@ def get_reachy():
     if reachy_connection is None:
         try:
             reachy_connection = ReachySDK(host='128.39.142.134')
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [green]Connected to Reachy[/green]")
+            _cache_joints(reachy_connection)
+            log("[green]Connected to Reachy[/green]")
         except Exception as e:
-            log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] [red]Failed to connect to Reachy: {e}[/red]")
+            log(f"[red]Failed to connect to Reachy: {e}[/red]")
             return None
     return reachy_connection
 
+def _joint_path(joint_name):
+    """Attribute path from the Reachy object to a joint"""
+    if joint_name in ('l_antenna', 'r_antenna') or joint_name.startswith('neck_'):
+        return f"head.{joint_name}"
+    if joint_name.startswith('r_'):
+        return f"r_arm.{joint_name}"
+    return f"l_arm.{joint_name}"
+
+
+# Joint name -> getter, built once instead of matching name prefixes on every lookup
+JOINT_DISPATCH = {joint_name: attrgetter(_joint_path(joint_name)) for joint_name in REACHY_JOINTS}
+
+# Joint name -> joint object of the shared connection, filled when it connects
+JOINT_CACHE = {}
+
+
+def _cache_joints(reachy):
+    """Resolve every joint of a new connection once, joints the robot lacks are left out"""
+    JOINT_CACHE.clear()
+    for joint_name, getter in JOINT_DISPATCH.items():
+        try:
+            JOINT_CACHE[joint_name] = getter(reachy)
+        except AttributeError:
+            pass
+
+
 def get_joint_by_name(reachy, joint_name):
     """Get joint object from Reachy by name"""
+    if reachy is not None and reachy is reachy_connection:
+        return JOINT_CACHE.get(joint_name)
+
+    getter = JOINT_DISPATCH.get(joint_name)
+    if getter is None:
+        return None
     try:
-        # Handle arm joints
-        if joint_name.startswith('r_') and joint_name != 'r_antenna':
-            return getattr(reachy.r_arm, joint_name, None)
-        elif joint_name.startswith('l_') and joint_name != 'l_antenna':
-            return getattr(reachy.l_arm, joint_name, None)
-        # Handle antenna joints
-        elif joint_name == 'l_antenna':
-            return getattr(reachy.head, 'l_antenna', None)
-        elif joint_name == 'r_antenna':
-            return getattr(reachy.head, 'r_antenna', None)
-        # Handle neck joints
-        elif joint_name == 'neck_yaw':
-            return reachy.head.neck_yaw
-        elif joint_name == 'neck_roll':
-            return reachy.head.neck_roll
-        elif joint_name == 'neck_pitch':
-            return reachy.head.neck_pitch
-        else:
-            return None
+        return getter(reachy)
+    except AttributeError:
+        # Part not present on this robot
+        return None
     except Exception as e:
-        log_lines.append(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Error getting joint {joint_name}: {e}")
+        log(f"Error getting joint {joint_name}: {e}")
         return None
-    
\ No newline at end of file
+
+
+def read_joint_positions(reachy):
+    """
+    Read the present position of every joint in one pass. The SDK keeps these
+    up to date from its state stream, so this makes no request per joint.
+
+    Returns:
+        (positions, nan_count) where positions maps joint names to positions
+        rounded to 2 decimals, NaN or unreadable positions become 0.0 and
+        joints missing from the robot are left out
+    """
+    positions = {}
+    nan_count = 0
+
+    for joint_name in REACHY_JOINTS:
+        joint = get_joint_by_name(reachy, joint_name)
+        if joint is None:
+            continue
+
+        try:
+            pos = float(joint.present_position)
+        except Exception:
+            # A joint that fails to read counts as NaN instead of failing the whole read
+            pos = math.nan
+
+        if math.isnan(pos):
+            positions[joint_name] = 0.0
+            nan_count += 1
+        else:
+            positions[joint_name] = round(pos, 2)
+
+    return positions, nan_count
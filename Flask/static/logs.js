@@ -80,6 +80,63 @@ async function fetchLogs() {
     }
 }
 
+// Streamed logs: the server pushes new lines, a 'reset' event replaces everything
+const MAX_LOG_LINES = 500;
+
+function appendLogLines(lines) {
+    const logsContent = document.getElementById('logsContent');
+    if (lines.length === 0) {
+        return;
+    }
+
+    const isScrolledToBottom = logsContent.scrollHeight - logsContent.clientHeight <= logsContent.scrollTop + 50;
+
+    const empty = logsContent.querySelector('.logs-empty');
+    if (empty) {
+        empty.remove();
+    }
+
+    lines.forEach(log => {
+        const logDiv = document.createElement('div');
+        logDiv.className = 'log-line';
+        logDiv.innerHTML = richMarkupToHtml(log);
+        logsContent.appendChild(logDiv);
+    });
+
+    // Keep the same window as the server-side buffer
+    while (logsContent.childElementCount > MAX_LOG_LINES) {
+        logsContent.firstElementChild.remove();
+    }
+    lastLogCount = logsContent.childElementCount;
+
+    // Only auto-scroll if user was already at the bottom
+    if (isScrolledToBottom) {
+        logsContent.scrollTop = logsContent.scrollHeight;
+    }
+}
+
+function resetLogLines(lines) {
+    const logsContent = document.getElementById('logsContent');
+    if (lines.length === 0) {
+        // Keep a "Logs cleared." notice if that is what is showing
+        if (!logsContent.querySelector('.logs-empty')) {
+            logsContent.innerHTML = '<div class="logs-empty">No logs available. Start the service to see logs.</div>';
+        }
+        lastLogCount = 0;
+        return;
+    }
+
+    logsContent.innerHTML = '';
+    appendLogLines(lines);
+}
+
+function streamLogs() {
+    // EventSource reconnects on its own, and every new connection starts with a reset
+    const source = new EventSource('/api/logs/stream');
+    source.addEventListener('reset', event => resetLogLines(JSON.parse(event.data)));
+    source.onmessage = event => appendLogLines(JSON.parse(event.data));
+}
+
 function richMarkupToHtml(text) {
     // Escape HTML entities first
     let html = text.replace(/&/g, '&amp;')
@@ -187,6 +244,11 @@ async function clearLogs() {
     }
 }
 
-// Fetch logs when the page loads and refresh every 2 seconds
-fetchLogs();
-setInterval(fetchLogs, 2000);
\ No newline at end of file
+// Stream logs when the browser supports it, otherwise fetch them when the
+// page loads and refresh every 2 seconds
+if (window.EventSource) {
+    streamLogs();
+} else {
+    fetchLogs();
+    setInterval(fetchLogs, 2000);
+}
\ No newline at end of file
@@ -3,15 +3,24 @@ import random
 import threading
 from rich import print
 
+# Constant (left, right) move sequences per mode, built once instead of every loop pass
+_ANTENNA_PRESETS = {
+    "sad": ((-125, 125), (-120, 120)),
+    "scanning": ((-125, 125), (-100, 100)),
+    "idle": ((0, 0),),
+}
+
 
 class AntennaController:
     def __init__(self, parent: "RobotController"):
         self.parent = parent
         self.reachy = parent.reachy
         self.current_antenna_mode = "idle"
+        self._last_goal = None
         self.start()
 
     def _set(self, left, right):
+        self._last_goal = (left, right)
         self.reachy.head.l_antenna.goal_position = left
         self.reachy.head.r_antenna.goal_position = right
 
@@ -20,7 +29,7 @@ class AntennaController:
         self._set(base_left + wiggle, base_right - wiggle)
         time.sleep(random.uniform(*sleep_range))
 
-    def _execute(self, moves: list[tuple[int, int]], interval):
+    def _execute(self, moves: tuple[tuple[int, int], ...], interval):
         for left, right in moves:
             self._set(left, right)
             time.sleep(interval)
@@ -31,15 +40,19 @@ class AntennaController:
             try:
                 match self.current_antenna_mode:
                     case "sad":
-                        self._execute([(-125, 125), (-120, 120)], 0.3)
+                        self._execute(_ANTENNA_PRESETS["sad"], 0.3)
                     case "tracking":
                         self._wiggle(-15, 15, (-15, 15), (0.3, 0.8))
                     case "scanning":
-                        self._execute([(-125, 125), (-100, 100)], 0.3)
+                        self._execute(_ANTENNA_PRESETS["scanning"], 0.3)
                     case "talking":
                         self._wiggle(-15, 15, (-25, 25), (0.2, 0.4))
                     case "idle":
-                        self._set(0, 0)
+                        # Only write the rest position once, then poll for a mode change
+                        rest = _ANTENNA_PRESETS["idle"][0]
+                        if self._last_goal != rest:
+                            self._set(*rest)
+                        time.sleep(0.05)
                     case _:
                         time.sleep(0.5)
             except Exception as e: